@@ -3,11 +3,11 @@
 from importlib import import_module
 from typing import TYPE_CHECKING
 
-__all__: list[str] = ["mcp", "main"]
+__all__: list[str] = ["mcp", "app", "main"]
 
 # Import lazily to avoid double-import issues when running as a module
 if TYPE_CHECKING:  # pragma: no cover - for static analyzers only
-    from .main import mcp, main  # noqa: F401
+    from .main import mcp, app, main  # noqa: F401
 
 
 def __getattr__(name: str):
@@ -0,0 +1,41 @@
+"""On-disk cache of processed manuscript images, served over HTTP under ``/cache``.
+
+Kept apart from :mod:`.logic` so that mounting the static route does not
+import the logic module's dependencies.
+"""
+
+import os
+from typing import TYPE_CHECKING
+
+from dotenv import load_dotenv
+from starlette.staticfiles import StaticFiles
+
+if TYPE_CHECKING:  # pragma: no cover - for static analyzers only
+    from starlette.applications import Starlette
+
+load_dotenv()
+
+# Processed manuscript images are cached here, keyed by the SHA-256 of their URL
+MANUSCRIPT_CACHE_DIR = os.getenv("SEFARIA_MCP_CACHE_DIR", "/tmp/sefaria_mcp_cache")
+# Image files live in their own subdirectory so only they are served
+MANUSCRIPT_IMAGE_DIR = os.path.join(MANUSCRIPT_CACHE_DIR, "images")
+CACHE_URL_PREFIX = "/cache"
+# Total size of the cached images; the least recently used are swept once it is exceeded
+MANUSCRIPT_CACHE_MAX_BYTES = int(os.getenv("SEFARIA_MCP_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+
+# A cached file's name is the hash of its source URL, so its content never changes
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """:class:`StaticFiles` that lets clients and proxies cache every file forever."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = _CACHE_CONTROL
+        return response
+
+
+def mount_image_cache(app: "Starlette") -> None:
+    """Serve the cached manuscript images at ``/cache/<sha256>.<ext>``."""
+    app.mount(CACHE_URL_PREFIX, ImmutableStaticFiles(directory=MANUSCRIPT_IMAGE_DIR, check_dir=False))
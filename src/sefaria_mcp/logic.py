@@ -1,15 +1,23 @@
+import asyncio
 import datetime
-import requests
-import json
+import httpx
+import orjson
 import urllib.parse
 import hdate
-import base64
+import hashlib
+import inspect
+import logging
+import tempfile
+import time
 from io import BytesIO
 from PIL import Image
 from typing import Callable, Any
 import os
 from dotenv import load_dotenv
 
+from .image_cache import CACHE_URL_PREFIX, MANUSCRIPT_CACHE_DIR, MANUSCRIPT_CACHE_MAX_BYTES, MANUSCRIPT_IMAGE_DIR
+from .results import ErrorResult, TimeoutResult
+
 load_dotenv()
 SEFARIA_API_BASE_URL = os.getenv("SEFARIA_API_BASE_URL", "https://www.sefaria.org")
 
@@ -25,6 +33,41 @@ else:
 # Maximum image size in bytes (1MB)
 MAX_IMAGE_SIZE = 1024 * 1024
 
+# Largest image accepted from upstream before resizing (32MB); anything bigger is refused
+MAX_DOWNLOAD_SIZE = 32 * 1024 * 1024
+
+# Most images get_manuscript_images accepts per call, and downloads at once; the
+# latter stays well below the image client's connection pool
+MAX_IMAGE_BATCH = 20
+MANUSCRIPT_DOWNLOAD_CONCURRENCY = 4
+
+# File extension used for each cached image type
+_IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/gif": "gif",
+}
+
+# Tool responses are pretty-printed unless SEFARIA_MCP_COMPACT_JSON=1; the indentation
+# adds a sizeable share to large search and text payloads
+_INDENT_OPTION = 0 if os.getenv("SEFARIA_MCP_COMPACT_JSON") == "1" else orjson.OPT_INDENT_2
+
+def _error_result(message: str, error: Exception) -> ErrorResult:
+    """Return *message* as the result of a call that failed with *error*, marking upstream timeouts."""
+    if isinstance(error, httpx.TimeoutException):
+        return TimeoutResult(message)
+    return ErrorResult(message)
+
+def _to_json(data, indent: bool = True) -> str:
+    """Serialises *data* to a JSON string (UTF-8, non-ASCII characters kept as is)."""
+    return orjson.dumps(data, option=_INDENT_OPTION if indent else 0).decode("utf-8")
+
+def _debug_dump(logger, label: str, data) -> None:
+    """Logs *data* as JSON at debug level; nothing is serialised unless debug logging is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", label, _to_json(data, indent=False))
+
 lexicon_map = {
     "Reference/Dictionary/Jastrow" : 'Jastrow Dictionary',
     "Reference/Dictionary/Klein Dictionary" : 'Klein Dictionary',
@@ -37,7 +80,51 @@ lexicon_names = list(lexicon_map.values())
 lexicon_search_filters = list(lexicon_map.keys())
 
 
-def get_request_json_data(endpoint, ref=None, param=None):
+# Shared HTTP clients: keep connections (and TLS sessions) alive across tool calls
+# instead of opening a new one per request. Manuscript images come from separate
+# image hosts and are large, slow downloads, so they get their own pool rather than
+# tying up connections to the Sefaria APIs.
+_HTTP_CLIENT_OPTIONS = {
+    "api": {
+        "limits": httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30),
+        "timeout": httpx.Timeout(15.0),
+    },
+    "images": {
+        "limits": httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60),
+        "timeout": httpx.Timeout(30.0),
+    },
+}
+_http_clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+def get_http_client(kind: str = "api") -> httpx.AsyncClient:
+    """
+    Returns the process-wide pooled HTTP client for *kind* ("api" or "images"), creating it on first use.
+
+    The client is tied to the event loop it was created on, so a new one is
+    built if the running loop changes.
+    """
+    loop = asyncio.get_running_loop()
+    client, client_loop = _http_clients.get(kind, (None, None))
+    if client is None or client.is_closed or client_loop is not loop:
+        client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            **_HTTP_CLIENT_OPTIONS[kind],
+        )
+        _http_clients[kind] = (client, loop)
+    return client
+
+
+async def close_http_client():
+    """Closes the shared HTTP clients; new ones are created on next use."""
+    clients = [client for client, _ in _http_clients.values()]
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def get_request_json_data(endpoint, ref=None, param=None):
     """
     Helper function to make GET requests to the Sefaria API and parse the JSON response.
     """
@@ -50,19 +137,19 @@ def get_request_json_data(endpoint, ref=None, param=None):
         url += f"?{param}"
 
     try:
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()  # Raise an exception for bad status codes
-        data = response.json()
+        data = orjson.loads(response.content)
         return data
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         print(f"Error during API request: {e}")
         return None
 
-def get_parasha_data():
+async def get_parasha_data():
     """
     Retrieves the weekly Parasha data using the Calendars API.
     """
-    data = get_request_json_data("api/calendars")
+    data = await get_request_json_data("api/calendars")
 
     if data:
         calendar_items = data.get('calendar_items', [])
@@ -75,6 +162,11 @@ def get_parasha_data():
     print("Could not retrieve Parasha data.")
     return None, None
 
+# The calendar changes at most once a day, so its response is reused for this many
+# seconds, and never past the date it was built for
+CALENDAR_CACHE_TTL = float(os.getenv("SEFARIA_MCP_CALENDAR_TTL", "3600"))
+_calendar_cache = {}  # date -> (expires_at, response)
+
 async def get_situational_info(logger):
     """
     Returns situational information related to the Jewish calendar.
@@ -91,27 +183,34 @@ async def get_situational_info(logger):
         # Get current Hebrew date
         # Note: This may be off by a day if server time and user timezone differ
         now = datetime.datetime.now()
+        cached = _calendar_cache.get(now.date())
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
         h = hdate.HDateInfo(now)  # Includes day of week
         
         # Get extended calendar information from Sefaria
         # Note: This will retrieve the Israel Parasha when Israel and diaspora differ
-        calendar_data = get_request_json_data("api/calendars")
+        calendar_data = await get_request_json_data("api/calendars")
         
         if not calendar_data:
-            return json.dumps({
+            return _to_json({
                 "error": "Could not retrieve calendar data from Sefaria",
                 "Hebrew Date": str(h)
-            })
+            }, indent=False)
         
         # Add Hebrew date to the response
         calendar_data["Hebrew Date"] = str(h)
         
-        return json.dumps(calendar_data, indent=2, ensure_ascii=False)
+        result = _to_json(calendar_data)
+        # Only today's entry is ever useful
+        _calendar_cache.clear()
+        _calendar_cache[now.date()] = (time.monotonic() + CALENDAR_CACHE_TTL, result)
+        return result
     
     except Exception as e:
-        return json.dumps({
+        return _to_json({
             "error": f"Error retrieving situational information: {str(e)}"
-        }, ensure_ascii=False)
+        }, indent=False)
 
 
 
@@ -147,22 +246,22 @@ async def get_text(logger, reference: str, version_language: str = None) -> str:
         if params:
             url += "?" + "&".join(params)
         
-        logger.debug(f"Text API request URL: {url}")
+        logger.debug("Text API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Optimize the response for LLM consumption
         optimized_data = _optimize_text_response(data)
         
-        return json.dumps(optimized_data, indent=2, ensure_ascii=False)
+        return _to_json(optimized_data)
     
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching text: {str(e)}"
-    except json.JSONDecodeError as e:
-        return f"Error parsing response: {str(e)}"
+    except httpx.HTTPError as e:
+        return _error_result(f"Error fetching text: {str(e)}", e)
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error parsing response: {str(e)}", e)
 
 
 async def _search(logger, query: str, filters=None, size=8):
@@ -179,8 +278,8 @@ async def _search(logger, query: str, filters=None, size=8):
         dict: The raw search results from the Sefaria API
         
     Raises:
-        requests.exceptions.RequestException: If there's an error communicating with the API
-        json.JSONDecodeError: If the API response cannot be parsed as JSON
+        httpx.HTTPError: If there's an error communicating with the API
+        orjson.JSONDecodeError: If the API response cannot be parsed as JSON
     """
     logger = _ensure_logger(logger)
     url = f"{SEFARIA_API_BASE_URL}/api/search-wrapper/es8"
@@ -211,23 +310,80 @@ async def _search(logger, query: str, filters=None, size=8):
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = await get_http_client().post(url, json=payload, headers=headers)
         response.raise_for_status()
 
-        logger.debug(f"Sefaria's Search API response: {response.text}")
+        logger.debug("Sefaria's Search API response: %s bytes", len(response.content))
 
-        # Parse JSON response
-        data = response.json()
+        # Parse the raw body directly; no need to decode it to text first
+        data = orjson.loads(response.content)
         return data
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON response: {str(e)}")
         raise
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during search API request: {str(e)}")
         raise
 
 
+# Caps the per-filter queries a multi-filter search sends to the search API at once
+_SEARCH_CONCURRENCY = 8
+_search_semaphore: tuple[asyncio.Semaphore, asyncio.AbstractEventLoop] | None = None
+
+
+def _get_search_semaphore() -> asyncio.Semaphore:
+    """Returns the semaphore bounding per-filter searches, rebuilt if the running loop changes."""
+    global _search_semaphore
+    loop = asyncio.get_running_loop()
+    if _search_semaphore is None or _search_semaphore[1] is not loop:
+        _search_semaphore = (asyncio.Semaphore(_SEARCH_CONCURRENCY), loop)
+    return _search_semaphore[0]
+
+async def _search_each_filter(logger, query: str, filters: list, size: int):
+    """
+    Runs one search per filter concurrently and merges the hits by score.
+    
+    Hits matched by more than one filter are only kept once, with their best score, and
+    only the best *size* hits are returned, in the same shape as a single _search response.
+    ``total`` is the sum of the per-filter totals, so it over-counts hits matched by
+    several filters.
+
+    A filter whose search fails is logged and left out of the results; the error is only
+    raised if every filter fails.
+    """
+    semaphore = _get_search_semaphore()
+
+    async def search_one(filter_path):
+        async with semaphore:
+            return await _search(logger, query, filter_path, size)
+
+    responses = await asyncio.gather(*(search_one(filter_path) for filter_path in filters), return_exceptions=True)
+
+    hits = {}
+    total = 0
+    errors = []
+    for filter_path, data in zip(filters, responses):
+        if isinstance(data, BaseException):
+            if not isinstance(data, Exception):
+                raise data
+            logger.warning("Search with filter %r failed: %s", filter_path, data)
+            errors.append(data)
+            continue
+        filter_total = data.get("hits", {}).get("total", 0)
+        if isinstance(filter_total, dict):
+            filter_total = filter_total.get("value", 0)
+        total += filter_total
+        for hit in data.get("hits", {}).get("hits", []):
+            key = hit.get("_id") or id(hit)
+            if key not in hits or (hit.get("_score") or 0) > (hits[key].get("_score") or 0):
+                hits[key] = hit
+    if errors and len(errors) == len(responses):
+        raise errors[0]
+    merged = sorted(hits.values(), key=lambda hit: hit.get("_score") or 0, reverse=True)
+    return {"hits": {"hits": merged[:size], "total": {"value": total}}}
+
+
 async def search_dictionaries(logger, query: str):
     """
     Given a text query, returns textual content of dictionary entries that match the query in any part of their entry.
@@ -236,7 +392,7 @@ async def search_dictionaries(logger, query: str):
         query (str): The search query for dictionary entries
         
     Returns:
-        list: A list of dictionary entries with ref, headword, lexicon_name, and text fields
+        str: JSON array of dictionary entries with ref, headword, lexicon_name, and text fields
     """
     logger = _ensure_logger(logger)
     try:
@@ -252,8 +408,8 @@ async def search_dictionaries(logger, query: str):
             for hit in response["hits"]["hits"]
         ]
         
-        logger.debug(f"Dictionary search results count: {len(results)}")
-        return results
+        logger.debug("Dictionary search results count: %s", len(results))
+        return orjson.dumps(results).decode("utf-8")
         
     except Exception as e:
         logger.error(f"Error during dictionary search: {str(e)}")
@@ -273,13 +429,16 @@ async def search_texts(logger, query: str, filters=None, size=10):
         size (int, optional): Maximum number of results to return. Default is 10.
 
     Returns:
-        list: A list of search results, each containing ref, categories, and text_snippet,
-        or a string message if no results found
+        str: JSON array of search results, each containing ref, categories, and text_snippet,
+        or an error message
     """
     logger = _ensure_logger(logger)
     try:
-        # Perform initial search with filters
-        data = await _search(logger, query, filters, size)
+        # Perform initial search with filters, one query per filter when there are several
+        if isinstance(filters, list) and len(filters) > 1:
+            data = await _search_each_filter(logger, query, filters, size)
+        else:
+            data = await _search(logger, query, filters, size)
         filter_used = filters
         
         # Check if we have no results and filters were provided
@@ -343,15 +502,15 @@ async def search_texts(logger, query: str, filters=None, size=10):
 
         # Return empty list if no results were found
         if len(filtered_results) == 0:
-            logger.debug(f"No results found for '{query}'")
-            return []
+            logger.debug("No results found for '%s'", query)
+            return "[]"
         
-        logger.debug(f"filtered results: {filtered_results}")
-        return filtered_results
+        _debug_dump(logger, "filtered results", filtered_results)
+        return orjson.dumps(filtered_results).decode("utf-8")
 
     except Exception as e:
         logger.error(f"Error during search: {str(e)}")
-        return f"Error during search: {str(e)}"
+        return _error_result(f"Error during search: {str(e)}", e)
 
 
 async def search_in_book(logger, query: str, book_name: str, size=10):
@@ -364,22 +523,22 @@ async def search_in_book(logger, query: str, book_name: str, size=10):
         size (int, optional): Maximum number of results to return. Default is 10.
 
     Returns:
-        list: A list of search results, each containing ref, categories, and text_snippet,
-        or a string message if no results found
+        str: JSON array of search results, each containing ref, categories, and text_snippet
+        ("[]" if nothing matched), or an ErrorResult if the book is unknown or the search fails
     """
     logger = _ensure_logger(logger)
     try:
         # Convert book name to filter path
         filter_path = await get_search_path_filter(logger, book_name)
         if not filter_path:
-            return f"Could not find valid filter path for book '{book_name}'"
+            return ErrorResult(f"Could not find valid filter path for book '{book_name}'")
             
         # Use the standard search_texts function with the converted filter path
         return await search_texts(logger, query, filter_path, size)
         
     except Exception as e:
         logger.error(f"Error during book search: {str(e)}")
-        return f"Error during book search: {str(e)}"
+        return _error_result(f"Error during book search: {str(e)}", e)
 
 
 async def get_name(logger, name: str, limit: int = None, type_filter: str = None) -> str:
@@ -412,23 +571,23 @@ async def get_name(logger, name: str, limit: int = None, type_filter: str = None
         if params:
             url += "?" + "&".join(params)
             
-        logger.debug(f"Name API request URL: {url}")
+        logger.debug("Name API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Name API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Name API response", data)
         
         # Return the raw JSON data
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _to_json(data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during name API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during name API request: {str(e)}", e)
 
 async def get_links(logger, reference: str, with_text: str = "0") -> str:
     """
@@ -446,7 +605,7 @@ async def get_links(logger, reference: str, with_text: str = "0") -> str:
     logger = _ensure_logger(logger)
 
     if not reference:
-        return f"No reference provided"
+        return ErrorResult(f"No reference provided")
     
     try:
         # URL encode the reference
@@ -459,26 +618,26 @@ async def get_links(logger, reference: str, with_text: str = "0") -> str:
         if params:
             url += "?" + "&".join(params)
             
-        logger.debug(f"Links API request URL: {url}")
+        logger.debug("Links API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Links API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Links API response", data)
         
         # Optimize the response for LLM consumption
         optimized_data = _optimize_links_response(data)
         
         # Return the optimized JSON data
-        return json.dumps(optimized_data, indent=2, ensure_ascii=False)
+        return _to_json(optimized_data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during links API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during links API request: {str(e)}", e)
 
 async def get_shape(logger, name: str) -> str:
     """
@@ -501,23 +660,23 @@ async def get_shape(logger, name: str) -> str:
         # Build the URL
         url = f"{SEFARIA_API_BASE_URL}/api/shape/{encoded_name}"
             
-        logger.debug(f"Shape API request URL: {url}")
+        logger.debug("Shape API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Shape API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Shape API response", data)
         
         # Return the raw JSON data
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _to_json(data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during shape API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during shape API request: {str(e)}", e)
 
 async def get_english_translations(logger, reference: str) -> str:
     """
@@ -534,12 +693,12 @@ async def get_english_translations(logger, reference: str) -> str:
         # Construct the API URL with the version=english|all parameter
         url = f"{SEFARIA_API_BASE_URL}/api/v3/texts/{urllib.parse.quote(reference)}?version=english|all"
         
-        logger.debug(f"English translations API request URL: {url}")
+        logger.debug("English translations API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Extract only version title and text from each English version
         simplified_translations = []
@@ -557,12 +716,12 @@ async def get_english_translations(logger, reference: str) -> str:
             "englishTranslations": simplified_translations
         }
         
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _to_json(result)
     
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching translations: {str(e)}"
-    except json.JSONDecodeError as e:
-        return f"Error parsing response: {str(e)}"
+    except httpx.HTTPError as e:
+        return _error_result(f"Error fetching translations: {str(e)}", e)
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error parsing response: {str(e)}", e)
 
 
 async def get_index(logger, title: str) -> str:
@@ -583,26 +742,26 @@ async def get_index(logger, title: str) -> str:
         # Build the URL
         url = f"{SEFARIA_API_BASE_URL}/api/v2/raw/index/{encoded_title}"
             
-        logger.debug(f"Index API request URL: {url}")
+        logger.debug("Index API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Index API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Index API response", data)
         
         # Optimize the response for LLM consumption
         optimized_data = _optimize_index_response(data)
         
         # Return the optimized JSON data
-        return json.dumps(optimized_data, indent=2, ensure_ascii=False)
+        return _to_json(optimized_data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during index API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during index API request: {str(e)}", e)
 
 async def get_topics(logger, topic_slug: str, with_links: bool = False, with_refs: bool = False) -> str:
     """
@@ -619,7 +778,7 @@ async def get_topics(logger, topic_slug: str, with_links: bool = False, with_ref
     logger = _ensure_logger(logger)
     try:
         if not topic_slug:
-            return f"No topic slug provided"
+            return ErrorResult(f"No topic slug provided")
         
         # URL encode the topic slug
         encoded_slug = urllib.parse.quote(topic_slug)
@@ -636,26 +795,26 @@ async def get_topics(logger, topic_slug: str, with_links: bool = False, with_ref
         if params:
             url += "?" + "&".join(params)
             
-        logger.debug(f"Topics API request URL: {url}")
+        logger.debug("Topics API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Topics API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Topics API response", data)
         
         # Optimize the response for LLM consumption
         optimized_data = _optimize_topics_response(data)
         
         # Return the optimized JSON data
-        return json.dumps(optimized_data, indent=2, ensure_ascii=False)
+        return _to_json(optimized_data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during topics API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during topics API request: {str(e)}", e)
 
 async def get_available_manuscripts(logger, reference: str) -> str:
     """
@@ -675,31 +834,222 @@ async def get_available_manuscripts(logger, reference: str) -> str:
         # Build the URL
         url = f"{SEFARIA_API_BASE_URL}/api/manuscripts/{encoded_reference}"
             
-        logger.debug(f"Manuscripts API request URL: {url}")
+        logger.debug("Manuscripts API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # Parse the response
-        data = response.json()
-        logger.debug(f"Manuscripts API response: {json.dumps(data, ensure_ascii=False)}")
+        data = orjson.loads(response.content)
+        _debug_dump(logger, "Manuscripts API response", data)
         
         # Check if any manuscripts were found
         if not data or len(data) == 0:
             return f"No manuscripts found for reference '{reference}'"
         
         # Return the raw JSON data
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _to_json(data)
     
-    except json.JSONDecodeError as e:
-        return f"Error: Failed to parse JSON response: {str(e)}"
-    except requests.exceptions.RequestException as e:
-        return f"Error during manuscripts API request: {str(e)}"
+    except orjson.JSONDecodeError as e:
+        return _error_result(f"Error: Failed to parse JSON response: {str(e)}", e)
+    except httpx.HTTPError as e:
+        return _error_result(f"Error during manuscripts API request: {str(e)}", e)
+
+def _manuscript_digest(image_url: str) -> str:
+    return hashlib.sha256(image_url.encode("utf-8")).hexdigest()
+
+def _manuscript_image_name(digest: str, content_type: str) -> str:
+    return f"{digest}.{_IMAGE_EXTENSIONS.get(content_type, 'img')}"
+
+def _read_cached_manuscript_image(digest: str):
+    """
+    Returns the cached metadata (content_type, size, original_size, was_resized) for the image
+    with URL hash *digest*, or None if it has not been downloaded yet.
+    """
+    try:
+        with open(os.path.join(MANUSCRIPT_CACHE_DIR, digest + ".json"), "rb") as f:
+            meta = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    try:
+        # Bump the mtime so the cache sweep evicts the least recently used images first
+        os.utime(os.path.join(MANUSCRIPT_IMAGE_DIR, _manuscript_image_name(digest, meta["content_type"])))
+    except OSError:
+        return None
+    return meta["content_type"], meta["size"], meta["original_size"], meta["was_resized"]
+
+def _write_cached_manuscript_meta(digest: str, content_type: str, size: int, original_size: int, was_resized: bool):
+    """Stores the metadata of a cached manuscript image, written last so readers never see a partial entry."""
+    meta_path = os.path.join(MANUSCRIPT_CACHE_DIR, digest + ".json")
+    meta = {"content_type": content_type, "size": size, "original_size": original_size, "was_resized": was_resized}
+    with open(meta_path + ".tmp", "wb") as f:
+        f.write(orjson.dumps(meta))
+    os.replace(meta_path + ".tmp", meta_path)
+
+def _prune_manuscript_cache(keep: str):
+    """
+    Deletes the least recently used cached images, with their metadata, until the images
+    total at most MANUSCRIPT_CACHE_MAX_BYTES. The image named *keep* is never deleted.
+    """
+    entries = []
+    total = 0
+    try:
+        with os.scandir(MANUSCRIPT_IMAGE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".part") or entry.name == keep:
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.name))
+                total += stat.st_size
+        total += os.path.getsize(os.path.join(MANUSCRIPT_IMAGE_DIR, keep))
+    except OSError:
+        return
+    if total <= MANUSCRIPT_CACHE_MAX_BYTES:
+        return
+    for _, size, name in sorted(entries):
+        digest = name.split(".", 1)[0]
+        # Drop the metadata first so the entry stops being a cache hit before its image goes
+        for path in (os.path.join(MANUSCRIPT_CACHE_DIR, digest + ".json"), os.path.join(MANUSCRIPT_IMAGE_DIR, name)):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        total -= size
+        if total <= MANUSCRIPT_CACHE_MAX_BYTES:
+            return
+
+def _resize_manuscript_image(logger, image_path: str, content_type: str, original_size: int):
+    """
+    Shrinks the image at *image_path* until it is below MAX_IMAGE_SIZE.
+
+    Returns:
+        bytes: The resized image, or None if it could not be made small enough
+    """
+    # Open image with PIL
+    image = Image.open(image_path)
+
+    # Calculate resize factor to get under MAX_IMAGE_SIZE
+    # We'll use an iterative approach since compressed size is hard to predict
+    resize_factor = 0.8  # Start with 80% of original size
+    max_attempts = 5
+
+    for attempt in range(max_attempts):
+        # Calculate new dimensions
+        new_width = int(image.width * resize_factor)
+        new_height = int(image.height * resize_factor)
+
+        # Resize image maintaining aspect ratio
+        resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+        # Convert back to bytes
+        output_buffer = BytesIO()
+
+        # Determine format for saving
+        save_format = 'JPEG'
+        if content_type == 'image/png':
+            save_format = 'PNG'
+        elif content_type == 'image/webp':
+            save_format = 'WEBP'
+
+        # Save with quality optimization for JPEG
+        if save_format == 'JPEG':
+            resized_image.save(output_buffer, format=save_format, quality=85, optimize=True)
+        else:
+            resized_image.save(output_buffer, format=save_format, optimize=True)
+
+        image_data = output_buffer.getvalue()
+        new_size = len(image_data)
+
+        logger.debug("Resize attempt %s: %sx%s, size: %s bytes", attempt + 1, new_width, new_height, new_size)
+
+        if new_size <= MAX_IMAGE_SIZE:
+            logger.debug("Successfully resized image from %s to %s bytes", original_size, new_size)
+            return image_data
+
+        # Reduce resize factor for next attempt
+        resize_factor *= 0.8
+
+    logger.warning(f"Could not resize image below {MAX_IMAGE_SIZE} bytes after {max_attempts} attempts")
+    return None
+
+async def _download_manuscript_image(logger, image_url: str, digest: str):
+    """
+    Streams a manuscript image straight into the image cache, resizing it if it is
+    larger than MAX_IMAGE_SIZE. The image is never held in memory unless it needs resizing,
+    and downloads larger than MAX_DOWNLOAD_SIZE are aborted with a ValueError.
+
+    Returns:
+        tuple: (content_type, final_size, original_size, was_resized)
+    """
+    logger.debug("Downloading manuscript image from: %s", image_url)
+
+    os.makedirs(MANUSCRIPT_IMAGE_DIR, exist_ok=True)
+    # Download to a temporary file first so readers never see a partial image
+    fd, part_path = tempfile.mkstemp(dir=MANUSCRIPT_IMAGE_DIR, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            async with get_http_client("images").stream("GET", image_url) as response:
+                response.raise_for_status()
+
+                # Get the content type to determine the MIME type
+                content_type = response.headers.get('content-type', 'image/jpeg')
+                if not content_type.startswith('image/'):
+                    content_type = 'image/jpeg'  # Default fallback
+
+                content_length = response.headers.get('content-length')
+                if content_length and content_length.isdigit() and int(content_length) > MAX_DOWNLOAD_SIZE:
+                    raise ValueError(f"Image is {int(content_length):,} bytes, over the {MAX_DOWNLOAD_SIZE:,} byte download limit")
+
+                # Content-Length may be missing or wrong, so count what actually arrives too
+                original_size = 0
+                async for chunk in response.aiter_bytes():
+                    original_size += len(chunk)
+                    if original_size > MAX_DOWNLOAD_SIZE:
+                        raise ValueError(f"Image exceeds the {MAX_DOWNLOAD_SIZE:,} byte download limit")
+                    f.write(chunk)
+
+        final_size = original_size
+        was_resized = False
+
+        # Check if image needs to be resized
+        if original_size > MAX_IMAGE_SIZE:
+            logger.debug("Image size %s bytes exceeds limit of %s bytes, resizing...", original_size, MAX_IMAGE_SIZE)
+            try:
+                # PIL decoding and re-encoding is CPU-bound, so keep it off the event loop
+                image_data = await asyncio.get_running_loop().run_in_executor(
+                    None, _resize_manuscript_image, logger, part_path, content_type, original_size
+                )
+            except Exception as resize_error:
+                logger.error(f"Error during image resize: {str(resize_error)}")
+                image_data = None
+            # Otherwise fall back to the original image
+            if image_data is not None:
+                with open(part_path, "wb") as f:
+                    f.write(image_data)
+                final_size = len(image_data)
+                was_resized = True
+
+        # mkstemp creates the file owner-only; cached images are public
+        os.chmod(part_path, 0o644)
+        os.replace(part_path, os.path.join(MANUSCRIPT_IMAGE_DIR, _manuscript_image_name(digest, content_type)))
+    except BaseException:
+        os.unlink(part_path)
+        raise
+
+    _write_cached_manuscript_meta(digest, content_type, final_size, original_size, was_resized)
+    # The sweep stats every cached file, so keep it off the event loop
+    await asyncio.get_running_loop().run_in_executor(None, _prune_manuscript_cache, _manuscript_image_name(digest, content_type))
+    return content_type, final_size, original_size, was_resized
 
 async def get_manuscript_image(logger, image_url: str, manuscript_title: str = None) -> dict:
     """
-    Downloads a manuscript image from the provided URL and returns it as base64 data.
+    Downloads a manuscript image from the provided URL into the local image cache and returns
+    a handle to it. The image itself is served by this server at ``image_path``, so repeated
+    calls for the same URL neither re-download it nor put the image bytes into the response.
     If the image is larger than MAX_IMAGE_SIZE, it will be resized while maintaining aspect ratio.
     
     Args:
@@ -707,92 +1057,19 @@ async def get_manuscript_image(logger, image_url: str, manuscript_title: str = N
         manuscript_title (str, optional): Title/description for the manuscript for display purposes
         
     Returns:
-        dict: Dictionary containing the image data and metadata for MCP response
+        dict: Dictionary containing the image path and metadata for MCP response
     """
     logger = _ensure_logger(logger)
     try:
-        logger.debug(f"Downloading manuscript image from: {image_url}")
+        digest = _manuscript_digest(image_url)
+        cached = _read_cached_manuscript_image(digest)
+        if cached:
+            logger.debug("Serving manuscript image from cache: %s", image_url)
+            content_type, final_size, original_size, was_resized = cached
+        else:
+            content_type, final_size, original_size, was_resized = await _download_manuscript_image(logger, image_url, digest)
         
-        # Download the image
-        response = requests.get(image_url, timeout=30)
-        response.raise_for_status()
-        
-        # Get the content type to determine the MIME type
-        content_type = response.headers.get('content-type', 'image/jpeg')
-        if not content_type.startswith('image/'):
-            content_type = 'image/jpeg'  # Default fallback
-        
-        original_size = len(response.content)
-        image_data = response.content
-        was_resized = False
-        
-        # Check if image needs to be resized
-        if original_size > MAX_IMAGE_SIZE:
-            logger.debug(f"Image size {original_size} bytes exceeds limit of {MAX_IMAGE_SIZE} bytes, resizing...")
-            
-            try:
-                # Open image with PIL
-                image = Image.open(BytesIO(response.content))
-                
-                # Calculate resize factor to get under MAX_IMAGE_SIZE
-                # We'll use an iterative approach since compressed size is hard to predict
-                resize_factor = 0.8  # Start with 80% of original size
-                max_attempts = 5
-                attempts = 0
-                
-                while attempts < max_attempts:
-                    # Calculate new dimensions
-                    new_width = int(image.width * resize_factor)
-                    new_height = int(image.height * resize_factor)
-                    
-                    # Resize image maintaining aspect ratio
-                    resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    # Convert back to bytes
-                    output_buffer = BytesIO()
-                    
-                    # Determine format for saving
-                    save_format = 'JPEG'
-                    if content_type == 'image/png':
-                        save_format = 'PNG'
-                    elif content_type == 'image/webp':
-                        save_format = 'WEBP'
-                    
-                    # Save with quality optimization for JPEG
-                    if save_format == 'JPEG':
-                        resized_image.save(output_buffer, format=save_format, quality=85, optimize=True)
-                    else:
-                        resized_image.save(output_buffer, format=save_format, optimize=True)
-                    
-                    image_data = output_buffer.getvalue()
-                    new_size = len(image_data)
-                    
-                    logger.debug(f"Resize attempt {attempts + 1}: {new_width}x{new_height}, size: {new_size} bytes")
-                    
-                    if new_size <= MAX_IMAGE_SIZE:
-                        was_resized = True
-                        logger.debug(f"Successfully resized image from {original_size} to {new_size} bytes")
-                        break
-                    
-                    # Reduce resize factor for next attempt
-                    resize_factor *= 0.8
-                    attempts += 1
-                
-                if attempts >= max_attempts:
-                    logger.warning(f"Could not resize image below {MAX_IMAGE_SIZE} bytes after {max_attempts} attempts")
-                    # Fall back to original image
-                    image_data = response.content
-                    
-            except Exception as resize_error:
-                logger.error(f"Error during image resize: {str(resize_error)}")
-                # Fall back to original image
-                image_data = response.content
-        
-        # Convert to base64
-        base64_data = base64.b64encode(image_data).decode('utf-8')
-        final_size = len(image_data)
-        
-        logger.debug(f"Successfully processed manuscript image, final size: {final_size} bytes")
+        logger.debug("Successfully processed manuscript image, final size: %s bytes", final_size)
         
         # Extract filename from URL for display
         filename = image_url.split('/')[-1]
@@ -805,9 +1082,10 @@ async def get_manuscript_image(logger, image_url: str, manuscript_title: str = N
         
         return {
             "success": True,
-            "image_data": base64_data,
-            "mime_type": content_type,
-            "size": final_size,
+            "image_path": f"{CACHE_URL_PREFIX}/{_manuscript_image_name(digest, content_type)}",
+            "content_type": content_type,
+            "bytes": final_size,
+            "sha256": digest,
             "original_size": original_size,
             "was_resized": was_resized,
             "filename": filename,
@@ -815,7 +1093,7 @@ async def get_manuscript_image(logger, image_url: str, manuscript_title: str = N
             "source_url": image_url
         }
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error downloading manuscript image: {str(e)}")
         return {
             "success": False,
@@ -828,9 +1106,61 @@ async def get_manuscript_image(logger, image_url: str, manuscript_title: str = N
             "error": f"Error processing manuscript image: {str(e)}"
         }
 
+async def get_manuscript_images(logger, image_urls: list, manuscript_titles: list = None) -> list:
+    """
+    Downloads several manuscript images concurrently; see get_manuscript_image.
+
+    At most MAX_IMAGE_BATCH images are accepted per call, and at most
+    MANUSCRIPT_DOWNLOAD_CONCURRENCY of them are downloaded at once so the batch cannot
+    exhaust the image client's connection pool. A URL listed more than once is only
+    downloaded once.
+    
+    Args:
+        image_urls (list): The URLs of the manuscript images to download
+        manuscript_titles (list, optional): Titles for the images, matched to image_urls by position
+        
+    Returns:
+        list: One get_manuscript_image result per URL, in the same order, or an error
+        message if too many URLs were given
+    """
+    logger = _ensure_logger(logger)
+    if len(image_urls) > MAX_IMAGE_BATCH:
+        return ErrorResult(f"Error: at most {MAX_IMAGE_BATCH} images can be downloaded at once, got {len(image_urls)}")
+
+    titles = list(manuscript_titles or [])
+    titles += [None] * (len(image_urls) - len(titles))
+    semaphore = asyncio.Semaphore(MANUSCRIPT_DOWNLOAD_CONCURRENCY)
+
+    async def fetch(image_url, title):
+        async with semaphore:
+            return await get_manuscript_image(logger, image_url, title)
+
+    # The first title given for each URL goes with its download
+    first_titles = {}
+    for image_url, title in zip(image_urls, titles):
+        first_titles.setdefault(image_url, title)
+    downloaded = dict(zip(first_titles, await asyncio.gather(*(
+        fetch(image_url, title) for image_url, title in first_titles.items()
+    ))))
+
+    results = []
+    for image_url, title in zip(image_urls, titles):
+        result = downloaded[image_url]
+        if result["success"] and title != first_titles[image_url]:
+            # Served from the cache the first download filled, with this position's title
+            result = await get_manuscript_image(logger, image_url, title)
+        results.append(result)
+    return results
+
+# Book name -> search filter path. The mapping only changes when books are added to the
+# library, so successful lookups are kept for the life of the process (up to a size cap).
+_SEARCH_PATH_FILTERS = {}
+_SEARCH_PATH_FILTERS_MAXSIZE = 10_000
+
 async def get_search_path_filter(logger, book_name: str) -> str:
     """
     Converts a book name into a valid search filter path using Sefaria's search-path-filter API.
+    Results are memoised in _SEARCH_PATH_FILTERS, which also serves search_in_book.
     
     Args:
         book_name (str): The name of the book to convert to a search filter path
@@ -839,6 +1169,9 @@ async def get_search_path_filter(logger, book_name: str) -> str:
         str: The search filter path string, or None if the conversion failed
     """
     logger = _ensure_logger(logger)
+    filter_path = _SEARCH_PATH_FILTERS.get(book_name)
+    if filter_path is not None:
+        return filter_path
     try:
         # URL encode the book name
         encoded_name = urllib.parse.quote(book_name)
@@ -846,25 +1179,29 @@ async def get_search_path_filter(logger, book_name: str) -> str:
         # Build the URL
         url = f"{SEFARIA_API_BASE_URL}/api/search-path-filter/{encoded_name}"
             
-        logger.debug(f"Search path filter API request URL: {url}")
+        logger.debug("Search path filter API request URL: %s", url)
         
         # Make the request
-        response = requests.get(url)
+        response = await get_http_client().get(url)
         response.raise_for_status()
         
         # The response is just a string, not JSON
         filter_path = response.text.strip()
-        logger.debug(f"Search path filter response: {filter_path}")
+        logger.debug("Search path filter response: %s", filter_path)
         
+        if filter_path and len(_SEARCH_PATH_FILTERS) < _SEARCH_PATH_FILTERS_MAXSIZE:
+            _SEARCH_PATH_FILTERS[book_name] = filter_path
         return filter_path
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during search path filter API request: {str(e)}")
         return None
 
 async def knn_search(logger, query: str, filters: dict = None) -> str:
     """
     Performs KNN search on embeddings of texts from Sefaria using the AI server.
+    The query embedding and the nearest-neighbour index both live on the AI server;
+    this function only forwards the query, so index tuning belongs there.
     
     Args:
         query (str): The search query to find similar text chunks
@@ -887,8 +1224,8 @@ async def knn_search(logger, query: str, filters: dict = None) -> str:
         if filters:
             payload["filters"] = filters
         
-        logger.debug(f"KNN search API request URL: {url}")
-        logger.debug(f"KNN search payload: {payload}")
+        logger.debug("KNN search API request URL: %s", url)
+        logger.debug("KNN search payload: %s", payload)
         
         # Get the bearer token from environment variable
         bearer_token = os.getenv("SEFARIA_AI_TOKEN")
@@ -897,30 +1234,56 @@ async def knn_search(logger, query: str, filters: dict = None) -> str:
             headers["Authorization"] = f"Bearer {bearer_token}"
         
         # Make the POST request
-        response = requests.post(url, json=payload, headers=headers)
+        response = await get_http_client().post(url, json=payload, headers=headers)
         response.raise_for_status()
         
         # Parse the JSON response
-        data = response.json()
-        logger.debug(f"KNN search response received, size: {len(str(data))} characters")
+        data = orjson.loads(response.content)
+        logger.debug("KNN search response received, size: %s bytes", len(response.content))
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _to_json(data)
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during KNN search API request: {str(e)}")
-        return json.dumps({
+        return _error_result(_to_json({
             "error": f"Error during KNN search API request: {str(e)}"
-        }, ensure_ascii=False)
-    except json.JSONDecodeError as e:
+        }, indent=False), e)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Error parsing KNN search response: {str(e)}")
-        return json.dumps({
+        return ErrorResult(_to_json({
             "error": f"Error parsing KNN search response: {str(e)}"
-        }, ensure_ascii=False) 
+        }, indent=False)) 
 
 # ---------------------------------------------------------------------------
 # Logger adapter utilities
 # ---------------------------------------------------------------------------
 
+# Debug output of the adapters below follows this logger's level
+_log = logging.getLogger(__name__)
+# Keeps a reference to each pending ctx.log call so it is not garbage collected
+_pending_logs: set[asyncio.Task] = set()
+
+
+def _log_sent(task: asyncio.Future) -> None:
+    _pending_logs.discard(task)
+    # A log message that could not be delivered must not fail anything else
+    if not task.cancelled():
+        task.exception()
+
+
+async def flush_logs() -> None:
+    """Wait until the ``ctx.log`` calls scheduled by the adapters on this loop have been sent.
+
+    FastMCP drops messages sent for a request that has already finished, so
+    the tools call this before returning.
+    """
+    # Let calls queued from worker threads be scheduled first
+    await asyncio.sleep(0)
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _pending_logs if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
 
 def _ensure_logger(logger: Any):
     """Normalise the *logger* argument so that calls like ``logger.debug(...)``
@@ -944,35 +1307,65 @@ def _ensure_logger(logger: Any):
 
     if callable(logger):
 
-        class _CallableLogger:  # pragma: no cover – simple delegate
+        class _CallableLogger:
             def __init__(self, cb):
                 self._cb = cb
+                # ``ctx.log`` is a coroutine function; its calls are scheduled on the
+                # loop the adapter was created on, which may be called from a worker thread
+                self._loop = asyncio.get_running_loop()
+
+            # Internal helper to build the message from logging-style (``msg, *args``) arguments
+            @staticmethod
+            def _format(*args) -> str:  # noqa: D401 – simple helper
+                if not args:
+                    return ""
+                message = args[0]
+                # Handle old-style % formatting if extra args provided
+                if len(args) > 1 and isinstance(message, str) and "%" in message:
+                    try:
+                        message = message % args[1:]
+                    except Exception:
+                        message = " ".join(str(a) for a in args)
+                return message
+
+            def isEnabledFor(self, level: int) -> bool:
+                return _log.isEnabledFor(level)
+
+            def _send(self, message: str, level: str):
+                result = self._cb(message, level)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    _pending_logs.add(task)
+                    task.add_done_callback(_log_sent)
+
+            # Mirror each log level to ctx.log and stdout. ``ctx.log`` does not do
+            # %-formatting itself, so the message is formatted here, only once
+            # the level check has passed.
+            def _emit(self, level: str, *args):
+                message = self._format(*args)
+                print(f"[{level.upper()}] {message}")
+                try:
+                    self._loop.call_soon_threadsafe(self._send, message, level)
+                except RuntimeError:
+                    # The loop has already been closed
+                    pass
+
+            # Debug messages are dropped before reaching ctx.log unless debug logging is enabled
+            def debug(self, *args, **kwargs):
+                if _log.isEnabledFor(logging.DEBUG):
+                    self._emit("debug", *args)
 
-            # Internal helper to mirror logs to server stdout
-            def _emit_stdout(self, level: str, *args, **kwargs):  # noqa: D401 – simple helper
-                if args:
-                    # If first arg is format string with %s style, rely on logging style simplicity
-                    message = args[0]
-                    # Handle old-style % formatting if extra args provided
-                    if len(args) > 1 and isinstance(message, str) and "%" in message:
-                        try:
-                            message = message % args[1:]
-                        except Exception:
-                            message = " ".join(str(a) for a in args)
-                else:
-                    message = ""
-                print(f"[{level}] {message}")
+            def info(self, *args, **kwargs):
+                self._emit("info", *args)
 
-            # Allow ``adapter("message")`` as a synonym for ``adapter.debug``
-            def __call__(self, *args, **kwargs):
-                self._cb(*args, **kwargs)
+            def warning(self, *args, **kwargs):
+                self._emit("warning", *args)
 
-            # Mirror each log level to ctx.log and stdout
-            def debug(self, *args, **kwargs):
-                self._cb(*args, **kwargs)
-                self._emit_stdout("DEBUG", *args, **kwargs)
+            def error(self, *args, **kwargs):
+                self._emit("error", *args)
 
-            info = warning = error = debug  # All levels map to same callable
+            # Allow ``adapter("message")`` as a synonym for ``adapter.debug``
+            __call__ = debug
 
         return _CallableLogger(logger)
 
@@ -986,6 +1379,9 @@ def _ensure_logger(logger: Any):
         def __call__(self, msg):
             print(msg)
 
+        def isEnabledFor(self, level: int) -> bool:
+            return _log.isEnabledFor(level)
+
         debug = info = warning = error = __call__  # type: ignore[attr-defined]
 
     return _PrintLogger() 
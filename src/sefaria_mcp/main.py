@@ -1,124 +1,164 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
-from fastmcp import FastMCP
-from prometheus_client import start_http_server, Counter, Histogram, Gauge
-from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
-from .tools import register_tools, set_metrics
+if TYPE_CHECKING:  # pragma: no cover - for static analyzers only
+    from fastmcp import FastMCP
+    from starlette.applications import Starlette
 
+    mcp: FastMCP
+    app: Starlette
 
-mcp = FastMCP("Sefaria MCP 📚")
 
-# Initialize metrics dictionary to pass to tools
-metrics_dict = {
-    'calls': None,
-    'duration': None,
-    'payload_bytes': None,
-    'errors': None,
-}
+logger = logging.getLogger(__name__)
 
-register_tools(mcp)
+_HEALTHZ_RESP = Response(b'{"status":"ok"}', media_type="application/json")
 
-# ---- WELL-KNOWN METADATA (no-auth stubs) ----
-PROTECTED_RESOURCE_DOC = {
-    # Use your actual origin, no trailing slash:
-    "resource": "https://devmcp.sefaria.org",
-    "authorization_servers": []  # <- explicitly none
-}
 
-# Add well-known OAuth endpoints using FastMCP's custom route decorator
-@mcp.custom_route("/.well-known/oauth-protected-resource", methods=["GET"])
-async def protected_resource_endpoint(request: Request) -> JSONResponse:
-    return JSONResponse(PROTECTED_RESOURCE_DOC)
+async def healthz_endpoint(request: Request) -> Response:
+    """Health check endpoint - returns 200 OK if server is responsive."""
+    return _HEALTHZ_RESP
 
-@mcp.custom_route("/.well-known/oauth-authorization-server", methods=["GET"])
-async def authorization_server_endpoint(request: Request) -> JSONResponse:
-    return JSONResponse({})
 
-# Defensive variants for clients that (incorrectly) append your path:
-@mcp.custom_route("/.well-known/oauth-protected-resource/sse", methods=["GET"])
-async def protected_resource_endpoint_sse(request: Request) -> JSONResponse:
-    return JSONResponse(PROTECTED_RESOURCE_DOC)
+# ---------------------------------------------------------------------------
+# Lazily-built server objects
+# ---------------------------------------------------------------------------
+# ``fastmcp`` and the Prometheus libraries are expensive to import, so the
+# server objects are only created the first time ``mcp`` or ``app`` is
+# accessed on this module.
 
-@mcp.custom_route("/.well-known/oauth-authorization-server/sse", methods=["GET"])
-async def authorization_server_endpoint_sse(request: Request) -> JSONResponse:
-    return JSONResponse({})
 
-@mcp.custom_route("/healthz", methods=["GET"])
-async def healthz_endpoint(request: Request) -> JSONResponse:
-    """Health check endpoint - returns 200 OK if server is responsive."""
-    return JSONResponse({"status": "ok"})
+# Keeps a reference to the tool registration warm-up task so it is not garbage collected
+_warmup_tasks: set[asyncio.Task] = set()
 
-# Get the FastMCP app - no need for custom wrapper
-app = mcp.http_app(transport="sse")
-app.router.redirect_slashes = False
 
-logger = logging.getLogger(__name__)
+@asynccontextmanager
+async def _lifespan(server: "FastMCP") -> AsyncIterator[dict]:
+    """Import the logic module in a worker thread and schedule the tool
+    registration once the server starts, and release the shared upstream HTTP
+    client when it stops.
+
+    The registration task runs on the server's own loop and is synchronous,
+    so it blocks the loop for its duration right after startup; requests that
+    arrive meanwhile wait for it rather than triggering it themselves."""
+    from .tools import ensure_tools_registered, preload_logic
 
-# Expose Prometheus metrics for MCP health and usage monitoring
-instrumentator = Instrumentator(
-    should_group_status_codes=True,
-    should_ignore_untemplated=True,
-    should_instrument_requests_inprogress=True,
-)
-instrumentator.instrument(app)
-
-# MCP-specific metrics
-mcp_tool_calls_total = Counter(
-    'mcp_tool_calls_total',
-    'Total number of MCP tool calls',
-    ['tool_name', 'status']
-)
-
-mcp_tool_duration_seconds = Histogram(
-    'mcp_tool_duration_seconds',
-    'Duration of MCP tool calls in seconds',
-    ['tool_name']
-)
-
-mcp_tool_payload_bytes = Histogram(
-    'mcp_tool_payload_bytes',
-    'Size of MCP tool response payloads in bytes',
-    ['tool_name'],
-    buckets=[100, 1000, 10000, 100000, 1000000, 10000000]
-)
-
-mcp_active_connections = Gauge(
-    'mcp_active_connections',
-    'Number of active MCP SSE connections'
-)
-
-mcp_errors_total = Counter(
-    'mcp_errors_total',
-    'Total number of MCP errors',
-    ['tool_name', 'error_type']
-)
-
-# Update metrics dictionary with actual metric objects
-metrics_dict['calls'] = mcp_tool_calls_total
-metrics_dict['duration'] = mcp_tool_duration_seconds
-metrics_dict['payload_bytes'] = mcp_tool_payload_bytes
-metrics_dict['errors'] = mcp_errors_total
-
-# Pass metrics to tools module
-set_metrics(metrics_dict)
-
-
-def start_metrics_server() -> None:
-    """Start the Prometheus metrics endpoint without crashing if the port is busy."""
-    metrics_port = 9090
+    # Fire and forget: the first tool call imports the module itself if the
+    # thread has not finished yet
+    asyncio.get_running_loop().run_in_executor(None, preload_logic)
+    task = asyncio.create_task(ensure_tools_registered(server))
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
     try:
-        start_http_server(metrics_port)
-    except OSError as exc:
-        logger.warning("Skipping metrics server on port %s: %s", metrics_port, exc)
+        yield {}
+    finally:
+        from .logic import close_http_client
+
+        await close_http_client()
+
+
+def _build_mcp() -> "FastMCP":
+    from fastmcp import FastMCP
+
+    from .tools import install_deferred_registration
+    from .well_known import register_well_known_routes
+
+    server = FastMCP("Sefaria MCP 📚", lifespan=_lifespan)
+    install_deferred_registration(server)
+    register_well_known_routes(server)
+    server.custom_route("/healthz", methods=["GET"])(healthz_endpoint)
+    return server
+
+
+def _build_app() -> "Starlette":
+    from .image_cache import mount_image_cache
+    from .metrics import TinyMetrics
+
+    # Worker processes import the app without going through main()
+    _configure_logging()
+
+    # Get the FastMCP app - no need for custom wrapper
+    starlette_app = _load("mcp").http_app(transport="sse")
+    starlette_app.router.redirect_slashes = False
+    mount_image_cache(starlette_app)
+
+    # Expose Prometheus metrics for MCP health and usage monitoring
+    starlette_app.add_middleware(TinyMetrics)
+    return starlette_app
+
+
+_LAZY_BUILDERS: dict[str, Callable[[], Any]] = {
+    "mcp": _build_mcp,
+    "app": _build_app,
+}
+
+
+def _load(name: str) -> Any:
+    """Return the lazily-built attribute *name*, building and caching it on first use."""
+    if name not in globals():
+        globals()[name] = _LAZY_BUILDERS[name]()
+    return globals()[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_BUILDERS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name}")
+
+
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Apply ``SEFARIA_MCP_LOG_LEVEL`` to the package's loggers.
+
+    uvicorn only configures its own loggers, so without this the debug logging
+    of the tools and logic modules (which is also what they forward to
+    ``ctx.log``) can never be turned on.
+    """
+    global _logging_configured
+    level = os.getenv("SEFARIA_MCP_LOG_LEVEL")
+    if _logging_configured or not level:
+        return
+    _logging_configured = True
+    package_logger = logging.getLogger("sefaria_mcp")
+    package_logger.setLevel(level.upper())
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    package_logger.addHandler(handler)
 
 
 def main() -> None:  # pragma: no cover – simple wrapper for console_scripts
+    import uvicorn
+
+    from .metrics import start_metrics_server
+
+    _configure_logging()
+
+    # FastMCP keeps SSE sessions in process memory, so extra workers are only
+    # safe behind a load balancer with sticky sessions.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1:
+        logger.warning("Running %s workers; SSE clients need sticky sessions", workers)
+
     start_metrics_server()
-    mcp.run(transport="sse", path="/sse", host="0.0.0.0", port=8088)
+    uvicorn.run(
+        "sefaria_mcp.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("SEFARIA_MCP_PORT", "8088")),
+        workers=workers,
+        # "auto" picks uvloop and httptools (both installed by uvicorn[standard]),
+        # falling back to asyncio / h11 on platforms without wheels (Windows, PyPy)
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        lifespan="on",
+    )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,139 @@
+"""Prometheus metrics for the Sefaria MCP server.
+
+Imported lazily by :mod:`sefaria_mcp.main` so ``prometheus_client`` is only
+loaded when the app or the metrics server is actually built.
+"""
+
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - for static analyzers only
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+logger = logging.getLogger(__name__)
+
+# Initialize metrics dictionary to pass to tools
+metrics_dict = {
+    'calls': None,
+    'duration': None,
+}
+
+
+# ---------------------------------------------------------------------------
+# HTTP metrics
+# ---------------------------------------------------------------------------
+
+# Paths reported by name; everything else is folded into "other" to keep the
+# label cardinality fixed
+_TRACKED_PATHS = frozenset({
+    "/sse",
+    "/messages/",
+    "/healthz",
+    "/.well-known/oauth-protected-resource",
+    "/.well-known/oauth-authorization-server",
+})
+
+_http_metrics: tuple | None = None
+
+
+def _build_http_metrics() -> tuple:
+    """Create the HTTP request Counter and Histogram once per process."""
+    global _http_metrics
+    if _http_metrics is None:
+        from prometheus_client import Counter, Histogram
+
+        _http_metrics = (
+            Counter('http_requests_total', 'Total number of HTTP requests', ['path', 'code']),
+            Histogram('http_request_duration_seconds', 'Duration of HTTP requests in seconds', ['path']),
+        )
+    return _http_metrics
+
+
+class TinyMetrics:
+    """ASGI middleware that counts HTTP requests and times them.
+
+    Status codes are grouped (``2xx``, ``4xx``...) and paths outside
+    ``_TRACKED_PATHS`` are reported as ``other``.
+    """
+
+    def __init__(self, app: "ASGIApp") -> None:
+        self.app = app
+        self.requests_total, self.request_duration = _build_http_metrics()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"] if scope["path"] in _TRACKED_PATHS else "other"
+        start = time.perf_counter()
+        response_started = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                self.requests_total.labels(path=path, code=f"{message['status'] // 100}xx").inc()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # Starlette's ServerErrorMiddleware sits outside this one and sends
+            # the 500 itself, so count it here
+            if not response_started:
+                self.requests_total.labels(path=path, code="5xx").inc()
+            raise
+        finally:
+            self.request_duration.labels(path=path).observe(time.perf_counter() - start)
+
+
+def _build_metrics() -> None:
+    """Create the MCP-specific Prometheus metrics and hand them to the tools module."""
+    if metrics_dict['calls'] is not None:
+        return
+
+    from prometheus_client import Counter, Histogram
+
+    from .tools import set_metrics
+
+    # MCP-specific metrics. Only metrics that back a dashboard or an alert
+    # belong here:
+    # - mcp_tool_calls_total: request and error rate per tool (status is one
+    #   of ok/error/timeout)
+    # - mcp_tool_duration_seconds: latency SLO per tool; the buckets are just
+    #   enough to compute the burn rate
+    mcp_tool_calls_total = Counter(
+        'mcp_tool_calls_total',
+        'Total number of MCP tool calls',
+        ['tool_name', 'status']
+    )
+
+    mcp_tool_duration_seconds = Histogram(
+        'mcp_tool_duration_seconds',
+        'Duration of MCP tool calls in seconds',
+        ['tool_name'],
+        buckets=(0.1, 0.5, 1, 5)
+    )
+
+    # Update metrics dictionary with actual metric objects
+    metrics_dict['calls'] = mcp_tool_calls_total
+    metrics_dict['duration'] = mcp_tool_duration_seconds
+
+    # Pass metrics to tools module
+    set_metrics(metrics_dict)
+
+
+def start_metrics_server() -> None:
+    """Start the Prometheus metrics endpoint without crashing if the port is busy."""
+    from prometheus_client import start_http_server
+
+    _build_metrics()
+    metrics_port = int(os.getenv("SEFARIA_MCP_METRICS_PORT", "9090"))
+    try:
+        start_http_server(metrics_port)
+    except OSError as exc:
+        logger.warning("Skipping metrics server on port %s: %s", metrics_port, exc)
@@ -0,0 +1,17 @@
+"""Marker type for the error messages the logic layer returns in place of a result.
+
+Kept apart from :mod:`.logic` so that :mod:`.tools` can recognise errors
+without importing the logic module's dependencies.
+"""
+
+
+class ErrorResult(str):
+    """An error message returned by a logic function; the tools never cache it."""
+
+    __slots__ = ()
+
+
+class TimeoutResult(ErrorResult):
+    """An :class:`ErrorResult` for an upstream request that timed out."""
+
+    __slots__ = ()
@@ -1,145 +1,442 @@
-from typing import List, Optional
-import json
+import asyncio
+import functools
+import inspect
+import itertools
+import logging
+import threading
 import time
-from fastmcp import FastMCP, Context
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
-from .logic import (
-    get_text as _get_text,
-    search_texts as _search_texts,
-    get_situational_info as _get_situational_info,
-    knn_search as _knn_search,
-    get_english_translations as _get_english_translations,
-    get_links as _get_links,
-    get_name as _get_name,
-    get_shape as _get_text_or_category_shape,
-    get_topics as _get_topics,
-    get_available_manuscripts as _get_available_manuscripts,
-    search_in_book as _search_in_book,
-    search_dictionaries as _search_in_dictionaries,
-    get_search_path_filter as _get_search_path_filter,
-    get_manuscript_image as _get_manuscript_image,
-    get_index as _get_index,
+import orjson
+from cachetools import TTLCache
+from fastmcp import FastMCP, Context
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from .results import ErrorResult, TimeoutResult
+
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Logic functions
+# ---------------------------------------------------------------------------
+# ``.logic`` pulls in httpx, Pillow and hdate, so it is not imported with this
+# module. The server preloads it in a worker thread at startup (see
+# :func:`preload_logic`), and any call that arrives first imports it on demand.
+
+_LOGIC: dict[str, Callable[..., Awaitable[Any]]] = {}
+
+def preload_logic() -> None:
+    """Import :mod:`.logic` and cache the coroutines the tools call."""
+    if _LOGIC:
+        return
+    from . import logic
+
+    _LOGIC.update({name: getattr(logic, name) for name in _LOGIC_NAMES})
+
+def _logic(name: str) -> Callable[..., Awaitable[Any]]:
+    """Return a coroutine function that calls ``logic.<name>``, resolving it on first use."""
+    async def call(*args, **kwargs):
+        fn = _LOGIC.get(name)
+        if fn is None:
+            preload_logic()
+            fn = _LOGIC[name]
+        return await fn(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+_get_text = _logic("get_text")
+_search_texts = _logic("search_texts")
+_get_situational_info = _logic("get_situational_info")
+_knn_search = _logic("knn_search")
+_get_english_translations = _logic("get_english_translations")
+_get_links = _logic("get_links")
+_get_name = _logic("get_name")
+_get_text_or_category_shape = _logic("get_shape")
+_get_topics = _logic("get_topics")
+_get_available_manuscripts = _logic("get_available_manuscripts")
+_search_in_book = _logic("search_in_book")
+_search_in_dictionaries = _logic("search_dictionaries")
+_get_search_path_filter = _logic("get_search_path_filter")
+_get_manuscript_image = _logic("get_manuscript_image")
+_get_manuscript_images = _logic("get_manuscript_images")
+_get_index = _logic("get_index")
+_flush_logs = _logic("flush_logs")
+
+_LOGIC_NAMES = (
+    "get_text", "search_texts", "get_situational_info", "knn_search",
+    "get_english_translations", "get_links", "get_name", "get_shape",
+    "get_topics", "get_available_manuscripts", "search_in_book",
+    "search_dictionaries", "get_search_path_filter", "get_manuscript_image",
+    "get_manuscript_images", "get_index", "flush_logs",
 )
 
+# orjson writes UTF-8 bytes directly (the equivalent of ``ensure_ascii=False``)
+_dumps = orjson.dumps
+
 # Import metrics from main module (will be set during initialization)
 _metrics = None
 
+# Label values allowed on the tool metrics, so the number of series per
+# metric stays small and fixed
+_STATUSES = ("ok", "error", "timeout")
+# Label names of each tool metric, in the order they were declared
+_LABELNAMES = {
+    'calls': ("tool_name", "status"),
+    'duration': ("tool_name",),
+}
+# Hard cap on series per metric, in case an unexpected label value slips through
+_MAX_SERIES_PER_METRIC = 256
+# Label values of the series created so far, per metric name
+_series: dict[str, set[tuple[str, ...]]] = {}
+
 def set_metrics(metrics_dict):
-    """Set the metrics objects from the main module."""
+    """Set the metrics objects from the main module and pre-create their series."""
     global _metrics
     _metrics = metrics_dict
+    _series.clear()
+    for spec in _TOOL_SPECS:
+        for status in _STATUSES:
+            _labelled('calls', tool_name=spec.name, status=status)
+        _labelled('duration', tool_name=spec.name)
+
+def _labelled(name: str, **labels):
+    """Return ``_metrics[name].labels(**labels)``, or ``None`` if that would exceed the per-metric series cap."""
+    key = tuple(str(labels[label]) for label in _LABELNAMES[name])
+    series = _series.setdefault(name, set())
+    if key not in series:
+        if len(series) >= _MAX_SERIES_PER_METRIC:
+            logger.warning("Dropping sample for %s%s: series limit reached", name, key)
+            return None
+        series.add(key)
+    return _metrics[name].labels(**labels)
+
+# Servers whose tool bodies have already been registered, see ensure_tools_registered()
+_registered_servers: "weakref.WeakSet[FastMCP]" = weakref.WeakSet()
+# A thread lock rather than an asyncio.Lock, so it is not bound to whichever loop first uses it
+_registration_lock = threading.Lock()
+
+
+class _DeferredToolRegistration(Middleware):
+    """Register the tool bodies before the first MCP request is handled."""
+
+    def __init__(self, mcp: FastMCP) -> None:
+        self._mcp = mcp
+
+    async def on_request(self, context: MiddlewareContext, call_next: CallNext):
+        await ensure_tools_registered(self._mcp)
+        return await call_next(context)
+
+
+def install_deferred_registration(mcp: FastMCP) -> None:
+    """Install the middleware that registers the tools with *mcp* on its first request.
+
+    Decorating the tools builds their JSON schemas, which is the bulk of the
+    server's startup cost, so it is postponed until the first MCP request (or
+    until a warm-up task calls :func:`ensure_tools_registered`). No tool is
+    registered by this call.
+    """
+    mcp.add_middleware(_DeferredToolRegistration(mcp))
+
+
+async def ensure_tools_registered(mcp: FastMCP) -> None:
+    """Run :func:`register_tool_bodies` for *mcp* exactly once.
+
+    Registration is synchronous and blocks the calling event loop while it runs;
+    callers on other threads or loops wait on the lock until it is done.
+    """
+    if mcp in _registered_servers:
+        return
+    with _registration_lock:
+        if mcp in _registered_servers:
+            return
+        register_tool_bodies(mcp)
+        _registered_servers.add(mcp)
+
+
+# ---------------------------------------------------------------------------
+# Utility
+# ---------------------------------------------------------------------------
+
+# Responses above this size (in characters) are logged as outliers
+_LARGE_PAYLOAD_CHARS = 1_000_000
+# Only one call in 16 has its response sized for the outlier check
+_SAMPLE_MASK = 0xF
+_sample_counter = itertools.count()
+
+@functools.singledispatch
+def _payload_size(payload) -> int:
+    """Return the approximate size of *payload* once serialised for transport.
+
+    Tools return strings, dicts or lists, each of which has its own handler
+    below (containers are estimated recursively, without serialising them);
+    anything else is measured by its ``str()``.
+    """
+    return len(str(payload))
+
+@_payload_size.register
+def _(payload: str) -> int:
+    # Characters rather than bytes: encoding just to count would walk the whole string
+    return len(payload)
+
+@_payload_size.register(bytes)
+@_payload_size.register(bytearray)
+def _(payload) -> int:
+    return len(payload)
+
+# Containers are walked instead of serialised; the estimate only feeds log lines.
+# Each entry adds a little for the quotes, colon and comma around it.
+@_payload_size.register
+def _(payload: dict) -> int:
+    return sum(_payload_size(key) + _payload_size(value) + 4 for key, value in payload.items())
+
+@_payload_size.register(list)
+@_payload_size.register(tuple)
+def _(payload) -> int:
+    return sum(_payload_size(item) + 2 for item in payload)
+
+@_payload_size.register(int)
+@_payload_size.register(float)
+@_payload_size.register(type(None))
+def _(payload) -> int:
+    return 8
+
+async def _dlog(ctx: Context, msg: str, **kwargs) -> None:
+    """Send a debug message to the client.
+
+    Nothing is formatted (no ``repr`` of the arguments) unless debug
+    logging is enabled, so argument-heavy calls cost nothing in production.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if kwargs:
+        msg = f"{msg} with " + ", ".join(f"{key}={value!r}" for key, value in kwargs.items())
+    await ctx.debug(msg)
+
+async def _log_response_size(ctx: Context, tool_name: str, payload) -> None:
+    """Log the exact UTF-8 response size; skipped unless debug logging is enabled.
+
+    Only this debug path pays for encoding a string response; everywhere
+    else strings are measured in characters.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        size = len(payload.encode("utf-8", "replace")) if isinstance(payload, str) else _payload_size(payload)
+        await ctx.debug(f"[{tool_name}] response size: {size} bytes")
+
+def _is_timeout(error: Exception) -> bool:
+    """Whether *error* is a timeout, including httpx's, which do not subclass :class:`TimeoutError`."""
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    # Matched by name so that httpx is not imported with this module
+    return any(cls.__name__ == "TimeoutException" for cls in type(error).__mro__)
+
+def _result_status(result) -> str:
+    """Metrics status of a call that returned *result*; the logic layer reports most failures as results."""
+    if isinstance(result, TimeoutResult):
+        return "timeout"
+    if isinstance(result, ErrorResult) or (isinstance(result, dict) and result.get("success") is False):
+        return "error"
+    return "ok"
+
+async def _run_with_metrics(tool_name: str, func, *args, **kwargs):
+    """Execute a coroutine and record metrics, without changing the tool signature."""
+    start_time = time.time()
+    status = "ok"
+    result = None
+    try:
+        result = await func(*args, **kwargs)
+        status = _result_status(result)
+        if next(_sample_counter) & _SAMPLE_MASK == 0 and (size := _payload_size(result)) > _LARGE_PAYLOAD_CHARS:
+            logger.warning("[%s] large response: %d chars", tool_name, size)
+        return result
+    except Exception as e:
+        status = "timeout" if _is_timeout(e) else "error"
+        raise
+    finally:
+        if _metrics:
+            duration = time.time() - start_time
+            if child := _labelled('duration', tool_name=tool_name):
+                child.observe(duration)
+            if child := _labelled('calls', tool_name=tool_name, status=status):
+                child.inc()
+
+
+# ---------------------------------------------------------------------------
+# Response caching
+# ---------------------------------------------------------------------------
+
+# Texts, indexes, topics and names change on the order of hours to days
+_CACHE_MAXSIZE = 2048
+_CACHE_TTL_SECONDS = 3600
+# Search results are keyed by free-form queries, so there are many more of them
+_SEARCH_CACHE_MAXSIZE = 10_000
+
+def _is_cacheable(result) -> bool:
+    """Only successful results are cached; the logic layer reports failures as ``None`` or an :class:`ErrorResult`."""
+    return result is not None and not isinstance(result, ErrorResult)
+
+def _freeze(value):
+    """Turn list and dict arguments (e.g. search filters) into hashable cache key parts."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+def _ttl_cached(fn, maxsize: int = _CACHE_MAXSIZE, ttl: float = _CACHE_TTL_SECONDS):
+    """Wrap a logic coroutine ``fn(logger, ...)`` in an in-process TTL cache.
+
+    The cache key is built from the call arguments only, never from the
+    per-request *logger*. No lock is needed: the loop never switches tasks
+    between a cache lookup and the code that acts on it.
+    """
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @functools.wraps(fn)
+    async def cached(logger, *args, **kwargs):
+        key = (_freeze(args), _freeze(kwargs))
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        result = await fn(logger, *args, **kwargs)
+        if _is_cacheable(result):
+            cache[key] = result
+        return result
 
-def register_tools(mcp: FastMCP) -> None:
-    """Register all tool functions with the provided :pyclass:`FastMCP` instance."""
+    cached.cache = cache
+    return cached
 
-    # ---------------------------------------------------------------------------
-    # Utility
-    # ---------------------------------------------------------------------------
 
-    def _payload_size(payload):  # type: ignore[ann-return-type]
-        """Return the length in bytes of *payload* once serialised for transport."""
-        if isinstance(payload, (bytes, bytearray)):
-            return len(payload)
-        if isinstance(payload, str):
-            return len(payload.encode())
-        try:
-            return len(json.dumps(payload, ensure_ascii=False).encode())
-        except Exception:
-            return len(str(payload).encode())
-
-    async def _run_with_metrics(tool_name: str, func, *args, **kwargs):
-        """Execute a coroutine and record metrics, without changing the tool signature."""
-        start_time = time.time()
-        status = "success"
-        result = None
-        try:
-            result = await func(*args, **kwargs)
-            if _metrics:
-                payload_size = _payload_size(result)
-                _metrics['payload_bytes'].labels(tool_name=tool_name).observe(payload_size)
-            return result
-        except Exception as e:
-            status = "error"
-            if _metrics:
-                error_type = type(e).__name__
-                _metrics['errors'].labels(tool_name=tool_name, error_type=error_type).inc()
-            raise
-        finally:
-            if _metrics:
-                duration = time.time() - start_time
-                _metrics['duration'].labels(tool_name=tool_name).observe(duration)
-                _metrics['calls'].labels(tool_name=tool_name, status=status).inc()
+def _single_flight(fn):
+    """Let concurrent identical calls of a logic coroutine ``fn(logger, ...)`` share one upstream request.
+
+    The first caller's *logger* receives the logs of the shared call. Each
+    caller awaits the shared task through :func:`asyncio.shield`, so one
+    cancelled caller does not cancel it for the others. Calls are only
+    shared within one event loop.
+    """
+    in_flight: dict[Any, asyncio.Future] = {}
+
+    def finished(key, task: asyncio.Future) -> None:
+        in_flight.pop(key, None)
+        # Retrieve the exception even if every caller was cancelled, so it is not logged as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    @functools.wraps(fn)
+    async def shared(logger, *args, **kwargs):
+        key = (asyncio.get_running_loop(), _freeze(args), _freeze(kwargs))
+        task = in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(logger, *args, **kwargs))
+            in_flight[key] = task
+            task.add_done_callback(functools.partial(finished, key))
+        return await asyncio.shield(task)
+
+    return shared
+
+
+# ---------------------------------------------------------------------------
+# Tool specifications
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Declarative description of one MCP tool, turned into a function by :func:`_make_wrapper`.
+
+    Attributes:
+        name: Tool name exposed to MCP clients.
+        fn: Underlying coroutine from :mod:`.logic`; called as ``fn(ctx.log, **arguments)``.
+        params: Tool parameters (excluding ``ctx``), in signature order.
+        doc: Tool docstring, used for the description and the argument docs.
+        stringify: Serialise non-string results to JSON before returning them.
+    """
+
+    name: str
+    fn: Callable[..., Awaitable[Any]]
+    params: tuple[inspect.Parameter, ...]
+    doc: str
+    stringify: bool = False
 
+
+def _param(name: str, annotation: Any, default: Any = inspect.Parameter.empty) -> inspect.Parameter:
+    return inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation)
+
+
+_CTX_PARAM = inspect.Parameter("ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context)
+
+_TOOL_SPECS: list[ToolSpec] = [
     # -----------------------------
     # Primary Tools (Top 4)
     # -----------------------------
-
-    async def get_text(ctx: Context, reference: str, version_language: str | None = None) -> str:
-        """
+    ToolSpec(
+        name="get_text",
+        fn=_ttl_cached(_get_text),
+        params=(
+            _param("reference", str),
+            _param("version_language", str | None, None),
+        ),
+        doc="""
         Retrieves the actual text content from a specific reference in the Jewish library.
-        
+
         Args:
             reference: Specific text reference (e.g. 'Genesis 1:1', 'Berakhot 2a').
             version_language: Which language version to retrieve - 'source', 'english', 'both', or omit for all.
-        
+
         Returns:
             JSON string with the text content.
-        """
-        ctx.log(f"[get_text] called with reference={reference!r}, version_language={version_language!r}")
-        result = await _run_with_metrics("get_text", _get_text, ctx.log, reference, version_language)
-        ctx.log(f"[get_text] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_text)
-
-    async def text_search(
-        ctx: Context,
-        query: str,
-        filters: Optional[List[str]] = None,
-        size: int = 10,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="text_search",
+        fn=_ttl_cached(_search_texts, maxsize=_SEARCH_CACHE_MAXSIZE),
+        params=(
+            _param("query", str),
+            _param("filters", list[str] | None, None),
+            _param("size", int, 10),
+        ),
+        doc="""
         Searches across the entire Jewish library for passages containing specific terms.
-        
+
         SEARCH TIPS:
         - Hebrew/Aramaic searches are more reliable than English translations
         - English searches can be hit-and-miss due to translation variations
         - If no results found, try searching with fewer words
         - Use specific Hebrew terms when possible for better accuracy
-        
+
         Args:
             query: Search terms (Hebrew/Aramaic preferred for best results).
             filters: Category paths to limit search scope.
             size: Maximum number of results to return.
-            
+
         Returns:
             JSON string with search results.
-        """
-        ctx.log(f"[text_search] called with query={query!r}, filters={filters!r}, size={size!r}")
-        result = await _run_with_metrics("text_search", _search_texts, ctx.log, query, filters, size)
-        ctx.log(f"[text_search] response size: {_payload_size(result)} bytes")
-        # Ensure we always return a string for MCP transport
-        return result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
-    
-    mcp.tool(text_search)
-
-    async def get_current_calendar(ctx: Context) -> str:
-        """Provides current Jewish calendar information including Hebrew date, parasha, holidays, etc."""
-        ctx.log("[get_current_calendar] called")
-        result = await _run_with_metrics("get_current_calendar", _get_situational_info, ctx.log)
-        ctx.log(f"[get_current_calendar] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_current_calendar)
-
-    async def english_semantic_search(ctx: Context, query: str, filters: Optional[dict] = None) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="get_current_calendar",
+        fn=_get_situational_info,
+        params=(),
+        doc="""Provides current Jewish calendar information including Hebrew date, parasha, holidays, etc.""",
+    ),
+    ToolSpec(
+        name="english_semantic_search",
+        fn=_ttl_cached(_single_flight(_knn_search), maxsize=_SEARCH_CACHE_MAXSIZE),
+        params=(
+            _param("query", str),
+            _param("filters", dict | None, None),
+        ),
+        doc="""
         Performs semantic similarity search on English embeddings of texts from Sefaria.
-        
+
         This tool uses semantic similarity to find text chunks that are conceptually 
         related to your query, even if they don't contain the exact same words.  Through this 
         you can discover texts that traditional keyword search or link search might miss
-        
+
         SEARCH TIPS:
         - This database is encoded from English.  Works well only with English queries
         - Search for phrases and sentences close to what you want to find.  Query for something close to the answer, not the question.
@@ -152,19 +449,19 @@ def register_tools(mcp: FastMCP) -> None:
                 - eras: List of historical periods. Valid values: "Tannaim", "Amoraim", "Geonim", "Rishonim", "Acharonim", "Contemporary"
                 - topics: List of topics (e.g., ["halakhah", "aggadah"]). Use get_name to validate topic names.
                 - places: List of composition places (e.g., ["Jerusalem", "Babylon"])
-            
+
         Returns:
             JSON string containing the nearest chunks with their original content and metadata.
-        """
-        ctx.log(f"[english_semantic_search] called with query={query!r}, filters={filters!r}")
-        result = await _run_with_metrics("english_semantic_search", _knn_search, ctx.log, query, filters)
-        ctx.log(f"[english_semantic_search] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(english_semantic_search)
-
-    async def get_links_between_texts(ctx: Context, reference: str, with_text: str = "0") -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="get_links_between_texts",
+        fn=_get_links,
+        params=(
+            _param("reference", str),
+            _param("with_text", str, "0"),
+        ),
+        doc="""
         Finds all cross-references and connections to a specific text passage.
 
         Args:
@@ -173,21 +470,17 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with the links data.
-        """
-        ctx.log(f"[get_links_between_texts] called with reference={reference!r}, with_text={with_text!r}")
-        result = await _run_with_metrics("get_links_between_texts", _get_links, ctx.log, reference, with_text)
-        ctx.log(f"[get_links_between_texts] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_links_between_texts)
-
-    async def search_in_book(
-        ctx: Context,
-        query: str,
-        book_name: str,
-        size: int = 10,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="search_in_book",
+        fn=_ttl_cached(_search_in_book, maxsize=_SEARCH_CACHE_MAXSIZE),
+        params=(
+            _param("query", str),
+            _param("book_name", str),
+            _param("size", int, 10),
+        ),
+        doc="""
         Searches for content within one specific book or text work.
 
         SEARCH TIPS:
@@ -203,17 +496,15 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with search results.
-        """
-        ctx.log(f"[search_in_book] called with query={query!r}, book_name={book_name!r}, size={size!r}")
-        result = await _run_with_metrics("search_in_book", _search_in_book, ctx.log, query, book_name, size)
-        ctx.log(f"[search_in_book] response size: {_payload_size(result)} bytes")
-        # Ensure we always return a string for MCP transport
-        return result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
-    
-    mcp.tool(search_in_book)
-
-    async def search_in_dictionaries(ctx: Context, query: str) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="search_in_dictionaries",
+        fn=_ttl_cached(_search_in_dictionaries, maxsize=_SEARCH_CACHE_MAXSIZE),
+        params=(
+            _param("query", str),
+        ),
+        doc="""
         Searches specifically within Jewish reference dictionaries.
 
         SEARCH TIPS:
@@ -227,21 +518,18 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with dictionary entries.
-        """
-        ctx.log(f"[search_in_dictionaries] called with query={query!r}")
-        result = await _run_with_metrics("search_in_dictionaries", _search_in_dictionaries, ctx.log, query)
-        ctx.log(f"[search_in_dictionaries] response size: {_payload_size(result)} bytes")
-        # Ensure we always return a string for MCP transport
-        return result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
-    
-    mcp.tool(search_in_dictionaries)
-
+        """,
+    ),
     # -----------------------------
     # English translations
     # -----------------------------
-
-    async def get_english_translations(ctx: Context, reference: str) -> str:
-        """
+    ToolSpec(
+        name="get_english_translations",
+        fn=_ttl_cached(_get_english_translations),
+        params=(
+            _param("reference", str),
+        ),
+        doc="""
         Retrieves all available English translations for a specific text reference.
 
         Args:
@@ -249,28 +537,20 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with all English translations.
-        """
-        ctx.log(f"[get_english_translations] called with reference={reference!r}")
-        result = await _run_with_metrics("get_english_translations", _get_english_translations, ctx.log, reference)
-        ctx.log(f"[get_english_translations] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_english_translations)
-
-
-
-
+        """,
+    ),
     # -----------------------------
     # Topics
     # -----------------------------
-
-    async def get_topic_details(
-        ctx: Context,
-        topic_slug: str,
-        with_links: bool = False,
-        with_refs: bool = False,
-    ) -> str:
-        """
+    ToolSpec(
+        name="get_topic_details",
+        fn=_ttl_cached(_get_topics),
+        params=(
+            _param("topic_slug", str),
+            _param("with_links", bool, False),
+            _param("with_refs", bool, False),
+        ),
+        doc="""
         Retrieves detailed information about specific topics in Jewish thought and texts.
 
         Args:
@@ -280,21 +560,17 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with topic data.
-        """
-        ctx.log(f"[get_topic_details] called with topic_slug={topic_slug!r}, with_links={with_links!r}, with_refs={with_refs!r}")
-        result = await _run_with_metrics("get_topic_details", _get_topics, ctx.log, topic_slug, with_links, with_refs)
-        ctx.log(f"[get_topic_details] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_topic_details)
-
-    async def clarify_name_argument(
-        ctx: Context,
-        name: str,
-        limit: int | None = None,
-        type_filter: str | None = None,
-    ) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="clarify_name_argument",
+        fn=_ttl_cached(_get_name),
+        params=(
+            _param("name", str),
+            _param("limit", int | None, None),
+            _param("type_filter", str | None, None),
+        ),
+        doc="""
         Validates and autocompletes text names, book titles, references, topic slugs, author names, and categories.
 
         Args:
@@ -304,16 +580,15 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with name suggestions including authors, topics, and categories.
-        """
-        ctx.log(f"[clarify_name_argument] called with name={name!r}, limit={limit!r}, type_filter={type_filter!r}")
-        result = await _run_with_metrics("clarify_name_argument", _get_name, ctx.log, name, limit, type_filter)
-        ctx.log(f"[clarify_name_argument] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(clarify_name_argument)
-
-    async def clarify_search_path_filter(ctx: Context, book_name: str) -> str:
-        """
+        """,
+    ),
+    ToolSpec(
+        name="clarify_search_path_filter",
+        fn=_get_search_path_filter,
+        params=(
+            _param("book_name", str),
+        ),
+        doc="""
         Converts a book name into a proper search filter path.
 
         Args:
@@ -321,18 +596,16 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             The search filter path string.
-        """
-        ctx.log(f"[clarify_search_path_filter] called with book_name={book_name!r}")
-        result = await _run_with_metrics("clarify_search_path_filter", _get_search_path_filter, ctx.log, book_name)
-        ctx.log(f"[clarify_search_path_filter] response size: {_payload_size(result)} bytes")
-        # Ensure we always return a string for MCP transport
-        return result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
-    
-    mcp.tool(clarify_search_path_filter)
-
-
-    async def get_text_or_category_shape(ctx: Context, name: str) -> str:
-        """
+        """,
+        stringify=True,
+    ),
+    ToolSpec(
+        name="get_text_or_category_shape",
+        fn=_ttl_cached(_get_text_or_category_shape),
+        params=(
+            _param("name", str),
+        ),
+        doc="""
         Retrieves the hierarchical structure and organization of texts or categories.
 
         Args:
@@ -340,20 +613,18 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with the shape data.
-        """
-        ctx.log(f"[get_text_or_category_shape] called with name={name!r}")
-        result = await _run_with_metrics("get_text_or_category_shape", _get_text_or_category_shape, ctx.log, name)
-        ctx.log(f"[get_text_or_category_shape] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_text_or_category_shape)
-
+        """,
+    ),
     # -----------------------------
     # Text Structure (moved to bottom)
     # -----------------------------
-
-    async def get_text_catalogue_info(ctx: Context, title: str) -> str:
-        """
+    ToolSpec(
+        name="get_text_catalogue_info",
+        fn=_ttl_cached(_get_index),
+        params=(
+            _param("title", str),
+        ),
+        doc="""
         Retrieves the bibliographic and structural information (index) for a text or work.
 
         Args:
@@ -361,20 +632,18 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with the index data.
-        """
-        ctx.log(f"[get_text_catalogue_info] called with title={title!r}")
-        result = await _run_with_metrics("get_text_catalogue_info", _get_index, ctx.log, title)
-        ctx.log(f"[get_text_catalogue_info] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_text_catalogue_info)
-
+        """,
+    ),
     # -----------------------------
     # Manuscript tools
     # -----------------------------
-
-    async def get_available_manuscripts(ctx: Context, reference: str) -> str:
-        """
+    ToolSpec(
+        name="get_available_manuscripts",
+        fn=_get_available_manuscripts,
+        params=(
+            _param("reference", str),
+        ),
+        doc="""
         Retrieves historical manuscript metadata and image URLs for text passages.
 
         Args:
@@ -382,32 +651,92 @@ def register_tools(mcp: FastMCP) -> None:
 
         Returns:
             JSON string with manuscript metadata.
-        """
-        ctx.log(f"[get_available_manuscripts] called with reference={reference!r}")
-        result = await _run_with_metrics("get_available_manuscripts", _get_available_manuscripts, ctx.log, reference)
-        ctx.log(f"[get_available_manuscripts] response size: {_payload_size(result)} bytes")
-        return result
-    
-    mcp.tool(get_available_manuscripts)
-
-    async def get_manuscript_image(
-        ctx: Context,
-        image_url: str,
-        manuscript_title: Optional[str] = None,
-    ) -> str:
-        """
-        Downloads and returns a specific manuscript image from a given image URL.
+        """,
+    ),
+    ToolSpec(
+        name="get_manuscript_image",
+        fn=_get_manuscript_image,
+        params=(
+            _param("image_url", str),
+            _param("manuscript_title", str | None, None),
+        ),
+        doc="""
+        Downloads a specific manuscript image from a given image URL and returns a link to it.
 
         Args:
             image_url: The URL of the manuscript image to download.
             manuscript_title: Title or description for the manuscript.
 
         Returns:
-            JSON string containing the image data and metadata.
-        """
-        ctx.log(f"[get_manuscript_image] called with image_url={image_url!r}, manuscript_title={manuscript_title!r}")
-        result = await _run_with_metrics("get_manuscript_image", _get_manuscript_image, ctx.log, image_url, manuscript_title)
-        ctx.log(f"[get_manuscript_image] response size: {_payload_size(result)} bytes")
-        return json.dumps(result, ensure_ascii=False)
-    
-    mcp.tool(get_manuscript_image)
+            JSON string with the image's path on this server (image_path) and its metadata.
+        """,
+        stringify=True,
+    ),
+    ToolSpec(
+        name="get_manuscript_images",
+        fn=_get_manuscript_images,
+        params=(
+            _param("image_urls", list[str]),
+            _param("manuscript_titles", list[str] | None, None),
+        ),
+        doc="""
+        Downloads several manuscript images at once; use instead of repeated get_manuscript_image calls.
+
+        Args:
+            image_urls: The URLs of the manuscript images to download, at most 20.
+            manuscript_titles: Titles or descriptions for the manuscripts, in the same order as image_urls.
+
+        Returns:
+            JSON string with one result per URL, each with the image's path on this server (image_path) and its metadata.
+        """,
+        stringify=True,
+    ),
+]
+
+
+def _encode_result(result) -> str:
+    """Return *result* as the JSON text sent over MCP, which only carries text content to clients."""
+    if isinstance(result, str):
+        return result
+    return _dumps(result).decode("utf-8")
+
+
+def _make_wrapper(spec: ToolSpec) -> Callable[..., Awaitable[str]]:
+    """Build the MCP tool function for *spec*.
+
+    The wrapper accepts keyword arguments only; its ``__signature__`` and
+    ``__annotations__`` are synthesised from ``spec.params`` so FastMCP's
+    schema extraction sees the same parameters as a hand-written function.
+    Everything the wrapper needs from *spec* is unpacked here, once, rather
+    than looked up on every call.
+    """
+    name, fn, stringify = spec.name, spec.fn, spec.stringify
+    defaults = tuple((p.name, p.default) for p in spec.params)
+    call_message = f"[{name}] called"
+
+    async def wrapper(ctx: Context, **kwargs: Any) -> str:
+        arguments = {key: kwargs.get(key, default) for key, default in defaults}
+        await _dlog(ctx, call_message, **arguments)
+        try:
+            result = await _run_with_metrics(name, fn, ctx.log, **arguments)
+        finally:
+            # Messages the logic layer logged must reach the client before the response
+            await _flush_logs()
+        await _log_response_size(ctx, name, result)
+        return _encode_result(result) if stringify else result
+
+    wrapper.__name__ = wrapper.__qualname__ = name
+    wrapper.__doc__ = spec.doc
+    wrapper.__signature__ = inspect.Signature([_CTX_PARAM, *spec.params], return_annotation=str)
+    wrapper.__annotations__ = {"ctx": Context, **{p.name: p.annotation for p in spec.params}, "return": str}
+    return wrapper
+
+
+# Built once at import; registering a server only hands these to FastMCP
+_TOOL_FUNCTIONS: tuple[Callable[..., Awaitable[str]], ...] = tuple(_make_wrapper(spec) for spec in _TOOL_SPECS)
+
+
+def register_tool_bodies(mcp: FastMCP) -> None:
+    """Register all tool functions with the provided :pyclass:`FastMCP` instance."""
+    for tool in _TOOL_FUNCTIONS:
+        mcp.tool(tool, name=tool.__name__)
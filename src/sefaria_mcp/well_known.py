@@ -0,0 +1,43 @@
+"""Well-known OAuth discovery documents (no-auth stubs)."""
+
+from typing import TYPE_CHECKING
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import Response
+
+if TYPE_CHECKING:  # pragma: no cover - for static analyzers only
+    from fastmcp import FastMCP
+
+
+PROTECTED_RESOURCE_DOC = {
+    # Use your actual origin, no trailing slash:
+    "resource": "https://devmcp.sefaria.org",
+    "authorization_servers": []  # <- explicitly none
+}
+
+# The bodies never change, so the responses are built once and shared
+# (Starlette responses hold no per-request state)
+_PROTECTED_RESOURCE_BYTES = orjson.dumps(PROTECTED_RESOURCE_DOC)
+_EMPTY_JSON = b"{}"
+_PR_RESP = Response(_PROTECTED_RESOURCE_BYTES, media_type="application/json")
+_AS_RESP = Response(_EMPTY_JSON, media_type="application/json")
+
+# Clients that (incorrectly) append your path get the same documents
+_PROTECTED_RESOURCE_PATHS = ("/.well-known/oauth-protected-resource", "/.well-known/oauth-protected-resource/sse")
+_AUTHORIZATION_SERVER_PATHS = ("/.well-known/oauth-authorization-server", "/.well-known/oauth-authorization-server/sse")
+
+
+def _register_well_known(server: "FastMCP", paths: tuple[str, ...], response: Response) -> None:
+    """Serve the prebuilt *response* on every path in *paths*."""
+    async def endpoint(request: Request) -> Response:
+        return response
+
+    for path in paths:
+        server.custom_route(path, methods=["GET"])(endpoint)
+
+
+def register_well_known_routes(server: "FastMCP") -> None:
+    """Add the well-known OAuth endpoints using FastMCP's custom route decorator."""
+    _register_well_known(server, _PROTECTED_RESOURCE_PATHS, _PR_RESP)
+    _register_well_known(server, _AUTHORIZATION_SERVER_PATHS, _AS_RESP)
@@ -0,0 +1,33 @@
+import logging
+
+import httpx
+import pytest
+
+from sefaria_mcp import logic
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("sefaria_mcp.tests")
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the logic layer's upstream calls to *handler*; returns the list of requests it sees."""
+    def install(handler):
+        seen = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        monkeypatch.setattr(logic, "get_http_client", lambda kind="api": client)
+        return seen
+
+    return install
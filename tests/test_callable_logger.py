@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import warnings
+
+import pytest
+
+from sefaria_mcp import logic
+
+pytestmark = pytest.mark.anyio
+
+
+class _ContextLog:
+    """Stands in for FastMCP's ``ctx.log`` coroutine function."""
+
+    def __init__(self):
+        self.records = []
+
+    async def __call__(self, message, level=None):
+        self.records.append((level, message))
+
+
+async def _drain():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_forwards_every_level_to_ctx_log(capsys):
+    ctx_log = _ContextLog()
+    logger = logic._ensure_logger(ctx_log)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        logger.info("No results for %s", "light")
+        logger.warning("slow")
+        logger.error("Error: %s", "boom")
+        await _drain()
+
+    assert ctx_log.records == [("info", "No results for light"), ("warning", "slow"), ("error", "Error: boom")]
+    assert capsys.readouterr().out.splitlines() == ["[INFO] No results for light", "[WARNING] slow", "[ERROR] Error: boom"]
+
+
+async def test_debug_follows_module_log_level():
+    ctx_log = _ContextLog()
+    logger = logic._ensure_logger(ctx_log)
+
+    logger.debug("hidden %s", 1)
+    await _drain()
+    assert ctx_log.records == []
+
+    logic._log.setLevel(logging.DEBUG)
+    try:
+        logger.debug("shown %s", 2)
+        await _drain()
+    finally:
+        logic._log.setLevel(logging.NOTSET)
+    assert ctx_log.records == [("debug", "shown 2")]
+
+
+async def test_logs_from_worker_threads_reach_ctx_log():
+    ctx_log = _ContextLog()
+    logger = logic._ensure_logger(ctx_log)
+
+    await asyncio.get_running_loop().run_in_executor(None, logger.warning, "from a thread")
+    await _drain()
+
+    assert ctx_log.records == [("warning", "from a thread")]
+
+
+async def test_flush_logs_waits_for_scheduled_messages():
+    sent = asyncio.Event()
+
+    async def slow_ctx_log(message, level=None):
+        await asyncio.sleep(0.01)
+        sent.set()
+
+    logger = logic._ensure_logger(slow_ctx_log)
+    await asyncio.get_running_loop().run_in_executor(None, logger.error, "from a thread")
+    await logic.flush_logs()
+
+    assert sent.is_set()
+    assert not logic._pending_logs
@@ -0,0 +1,64 @@
+"""Every failure the logic layer reports must be recognised by the tool caches."""
+
+import httpx
+import orjson
+import pytest
+
+from sefaria_mcp import logic
+from sefaria_mcp.results import ErrorResult
+from sefaria_mcp.tools import _is_cacheable
+
+pytestmark = pytest.mark.anyio
+
+CALLS = {
+    "get_text": ("Genesis 1:1",),
+    "search_texts": ("light",),
+    "search_texts/filters": ("light", ["Tanakh", "Mishnah"]),
+    "search_in_book": ("light", "Genesis"),
+    "knn_search": ("light",),
+    "get_name": ("Gen",),
+    "get_links": ("Genesis 1:1",),
+    "get_shape": ("Genesis",),
+    "get_english_translations": ("Genesis 1:1",),
+    "get_index": ("Genesis",),
+    "get_topics": ("moses",),
+    "get_available_manuscripts": ("Genesis 1:1",),
+}
+
+FAILURES = {
+    "http-500": lambda request: httpx.Response(500, text="boom"),
+    "malformed": lambda request: httpx.Response(200, content=b"{not json"),
+}
+
+
+@pytest.mark.parametrize("failure", FAILURES)
+@pytest.mark.parametrize("call", CALLS)
+async def test_upstream_failures_are_not_cacheable(mock_http, logger, monkeypatch, call, failure):
+    monkeypatch.setattr(logic, "_SEARCH_PATH_FILTERS", {})
+    mock_http(FAILURES[failure])
+
+    result = await getattr(logic, call.split("/")[0])(logger, *CALLS[call])
+
+    assert isinstance(result, ErrorResult)
+    assert not _is_cacheable(result)
+
+
+@pytest.mark.parametrize("call, args", [
+    ("get_links", ("",)),
+    ("get_topics", ("",)),
+])
+async def test_missing_arguments_are_not_cacheable(logger, call, args):
+    assert not _is_cacheable(await getattr(logic, call)(logger, *args))
+
+
+async def test_successful_results_are_cacheable(mock_http, logger):
+    mock_http(lambda request: httpx.Response(200, content=orjson.dumps({"hits": {"hits": [], "total": 0}})))
+
+    assert _is_cacheable(await logic.search_texts(logger, "light"))
+    assert not _is_cacheable(None)
+    # A result that merely reads like an error is still a result
+    assert _is_cacheable("Error correction in the Masoretic text")
+
+
+def test_error_results_serialise_as_plain_strings():
+    assert orjson.loads(orjson.dumps({"text": ErrorResult("Error: x")})) == {"text": "Error: x"}
@@ -0,0 +1,44 @@
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from sefaria_mcp.metrics import TinyMetrics
+
+pytestmark = pytest.mark.anyio
+
+
+async def _ok(request):
+    return PlainTextResponse("ok")
+
+
+async def _boom(request):
+    raise RuntimeError("boom")
+
+
+def _count(code):
+    return REGISTRY.get_sample_value("http_requests_total", {"path": "other", "code": code}) or 0
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/ok", _ok), Route("/boom", _boom)])
+    app.add_middleware(TinyMetrics)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def test_counts_responses_by_status_class(client):
+    before = _count("2xx")
+
+    assert (await client.get("/ok")).status_code == 200
+    assert _count("2xx") == before + 1
+
+
+async def test_counts_unhandled_errors_as_5xx(client):
+    before = _count("5xx")
+
+    assert (await client.get("/boom")).status_code == 500
+    assert _count("5xx") == before + 1
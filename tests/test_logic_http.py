@@ -0,0 +1,65 @@
+import httpx
+import orjson
+import pytest
+
+from sefaria_mcp import logic
+
+pytestmark = pytest.mark.anyio
+
+
+def _search_body(*hits, total=None):
+    return {"hits": {"hits": list(hits), "total": {"value": len(hits) if total is None else total}}}
+
+
+async def test_search_returns_parsed_body(mock_http, logger):
+    body = _search_body({"_id": "a", "_score": 1.0, "_source": {"ref": "Genesis 1:1"}})
+    seen = mock_http(lambda request: httpx.Response(200, content=orjson.dumps(body)))
+
+    assert await logic._search(logger, "light", "Tanakh", 5) == body
+    payload = orjson.loads(seen[0].content)
+    assert payload["filters"] == ["Tanakh"]
+    assert payload["size"] == 5
+
+
+async def test_search_raises_http_error_on_non_2xx(mock_http, logger):
+    mock_http(lambda request: httpx.Response(500, text="boom"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await logic._search(logger, "light")
+
+
+async def test_search_raises_decode_error_on_malformed_body(mock_http, logger):
+    mock_http(lambda request: httpx.Response(200, content=b"{not json"))
+
+    with pytest.raises(orjson.JSONDecodeError):
+        await logic._search(logger, "light")
+
+
+@pytest.mark.parametrize("response", [
+    httpx.Response(500, text="boom"),
+    httpx.Response(200, content=b"<html>"),
+])
+async def test_search_tools_report_upstream_failures(mock_http, logger, response):
+    mock_http(lambda request: response)
+
+    assert (await logic.search_texts(logger, "light")).startswith("Error during search:")
+    assert (await logic.search_texts(logger, "light", ["Tanakh", "Mishnah"])).startswith("Error during search:")
+    with pytest.raises((httpx.HTTPError, orjson.JSONDecodeError)):
+        await logic.search_dictionaries(logger, "light")
+
+
+async def test_get_request_json_data(mock_http):
+    seen = mock_http(lambda request: httpx.Response(200, json={"calendar_items": []}))
+
+    assert await logic.get_request_json_data("api/calendars", param="diaspora=1") == {"calendar_items": []}
+    assert str(seen[0].url).endswith("/api/calendars?diaspora=1")
+
+
+@pytest.mark.parametrize("response", [
+    httpx.Response(404, text="missing"),
+    httpx.Response(200, content=b"{not json"),
+])
+async def test_get_request_json_data_returns_none_on_failure(mock_http, response):
+    mock_http(lambda request: response)
+
+    assert await logic.get_request_json_data("api/calendars") is None
@@ -0,0 +1,36 @@
+import logging
+
+import pytest
+
+from sefaria_mcp import logic, main, tools
+
+
+@pytest.fixture
+def package_logger(monkeypatch):
+    package_logger = logging.getLogger("sefaria_mcp")
+    handlers = list(package_logger.handlers)
+    monkeypatch.setattr(main, "_logging_configured", False)
+    yield package_logger
+    package_logger.setLevel(logging.NOTSET)
+    package_logger.handlers[:] = handlers
+
+
+def test_log_level_switch_enables_debug_paths(monkeypatch, package_logger):
+    monkeypatch.setenv("SEFARIA_MCP_LOG_LEVEL", "debug")
+
+    main._configure_logging()
+    main._configure_logging()
+
+    assert package_logger.level == logging.DEBUG
+    assert len(package_logger.handlers) == 1
+    assert tools.logger.isEnabledFor(logging.DEBUG)
+    assert logic._log.isEnabledFor(logging.DEBUG)
+
+
+def test_logging_left_alone_without_the_switch(monkeypatch, package_logger):
+    monkeypatch.delenv("SEFARIA_MCP_LOG_LEVEL", raising=False)
+
+    main._configure_logging()
+
+    assert package_logger.level == logging.NOTSET
+    assert not tools.logger.isEnabledFor(logging.DEBUG)
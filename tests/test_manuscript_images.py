@@ -0,0 +1,186 @@
+import asyncio
+import os
+import threading
+from io import BytesIO
+
+import httpx
+import pytest
+from PIL import Image
+
+from sefaria_mcp import logic
+from sefaria_mcp.results import ErrorResult
+
+pytestmark = pytest.mark.anyio
+
+IMAGE_URL = "https://manuscripts.example.org/page/1.jpg"
+
+
+@pytest.fixture
+def image_cache(tmp_path, monkeypatch):
+    image_dir = tmp_path / "images"
+    monkeypatch.setattr(logic, "MANUSCRIPT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(logic, "MANUSCRIPT_IMAGE_DIR", str(image_dir))
+    return image_dir
+
+
+def _part_files(image_dir):
+    return [name for name in os.listdir(image_dir) if name.endswith(".part")]
+
+
+async def test_download_refuses_oversized_content_length(mock_http, logger, image_cache):
+    size = logic.MAX_DOWNLOAD_SIZE + 1
+    mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/jpeg", "content-length": str(size)}))
+
+    result = await logic.get_manuscript_image(logger, IMAGE_URL)
+
+    assert result["success"] is False
+    assert "download limit" in result["error"]
+    assert _part_files(image_cache) == []
+
+
+async def test_download_aborts_stream_past_limit(mock_http, logger, image_cache, monkeypatch):
+    monkeypatch.setattr(logic, "MAX_DOWNLOAD_SIZE", 1000)
+
+    async def chunks():
+        for _ in range(10):
+            yield b"x" * 200
+
+    mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/jpeg"}, content=chunks()))
+
+    result = await logic.get_manuscript_image(logger, IMAGE_URL)
+
+    assert result["success"] is False
+    assert "download limit" in result["error"]
+    assert _part_files(image_cache) == []
+    assert logic._read_cached_manuscript_image(logic._manuscript_digest(IMAGE_URL)) is None
+
+
+def _seed(image_cache, digest, size, mtime):
+    image_cache.mkdir(exist_ok=True)
+    logic._write_cached_manuscript_meta(digest, "image/jpeg", size, size, False)
+    path = image_cache / f"{digest}.jpg"
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_evicts_least_recently_used(image_cache, monkeypatch):
+    monkeypatch.setattr(logic, "MANUSCRIPT_CACHE_MAX_BYTES", 250)
+    _seed(image_cache, "old", 100, 1_000)
+    _seed(image_cache, "mid", 100, 2_000)
+    _seed(image_cache, "new", 100, 3_000)
+    _seed(image_cache, "kept", 100, 500)
+
+    logic._prune_manuscript_cache("kept.jpg")
+
+    assert sorted(os.listdir(image_cache)) == ["kept.jpg", "new.jpg"]
+    assert logic._read_cached_manuscript_image("old") is None
+    assert logic._read_cached_manuscript_image("mid") is None
+    assert logic._read_cached_manuscript_image("new") is not None
+
+
+def test_cache_hit_refreshes_mtime(image_cache):
+    _seed(image_cache, "hit", 10, 1_000)
+
+    assert logic._read_cached_manuscript_image("hit") == ("image/jpeg", 10, 10, False)
+    assert os.path.getmtime(image_cache / "hit.jpg") > 1_000
+
+
+async def test_large_image_is_resized_off_the_event_loop(mock_http, logger, image_cache, monkeypatch):
+    buffer = BytesIO()
+    Image.new("RGB", (64, 64), "white").save(buffer, format="PNG")
+    body = buffer.getvalue()
+    monkeypatch.setattr(logic, "MAX_IMAGE_SIZE", len(body) - 1)
+
+    resize = logic._resize_manuscript_image
+    threads = []
+
+    def recording_resize(*args):
+        threads.append(threading.current_thread())
+        return resize(*args)
+
+    monkeypatch.setattr(logic, "_resize_manuscript_image", recording_resize)
+    mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=body))
+
+    result = await logic.get_manuscript_image(logger, IMAGE_URL)
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert result["success"] is True
+    assert result["original_size"] == len(body)
+
+
+async def test_cache_miss_then_hit(mock_http, logger, image_cache):
+    seen = mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=b"\x89PNG small"))
+
+    first = await logic.get_manuscript_image(logger, IMAGE_URL, "Leningrad Codex")
+    second = await logic.get_manuscript_image(logger, IMAGE_URL, "Leningrad Codex")
+
+    assert len(seen) == 1
+    assert first == second
+    digest = logic._manuscript_digest(IMAGE_URL)
+    assert first["success"] is True
+    assert first["image_path"] == f"{logic.CACHE_URL_PREFIX}/{digest}.png"
+    assert first["bytes"] == first["original_size"] == len(b"\x89PNG small")
+    assert (image_cache / f"{digest}.png").read_bytes() == b"\x89PNG small"
+    assert oct(os.stat(image_cache / f"{digest}.png").st_mode & 0o777) == "0o644"
+    assert _part_files(image_cache) == []
+
+
+async def test_http_failure_leaves_no_partial_file(mock_http, logger, image_cache):
+    seen = mock_http(lambda request: httpx.Response(503, text="unavailable"))
+
+    result = await logic.get_manuscript_image(logger, IMAGE_URL)
+    await logic.get_manuscript_image(logger, IMAGE_URL)
+
+    assert result["success"] is False
+    assert result["error"].startswith("Error downloading manuscript image:")
+    # Failures are not cached, so the second call retried the download
+    assert len(seen) == 2
+    assert os.listdir(image_cache) == []
+
+
+async def test_interrupted_stream_leaves_no_partial_file(mock_http, logger, image_cache):
+    async def chunks():
+        yield b"x" * 100
+        raise httpx.ReadError("connection reset")
+
+    mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/jpeg"}, content=chunks()))
+
+    result = await logic.get_manuscript_image(logger, IMAGE_URL)
+
+    assert result["success"] is False
+    assert os.listdir(image_cache) == []
+    assert logic._read_cached_manuscript_image(logic._manuscript_digest(IMAGE_URL)) is None
+
+
+async def test_batch_downloads_each_url_once_with_bounded_concurrency(mock_http, logger, image_cache, monkeypatch):
+    monkeypatch.setattr(logic, "MANUSCRIPT_DOWNLOAD_CONCURRENCY", 2)
+    active = peak = 0
+
+    async def body():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        yield b"\x89PNG small"
+
+    seen = mock_http(lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=body()))
+    urls = [f"https://manuscripts.example.org/page/{n}.png" for n in range(5)]
+
+    results = await logic.get_manuscript_images(logger, urls + [urls[0]], ["first"] + [None] * 4 + ["again"])
+
+    assert len(seen) == 5
+    assert peak == 2
+    assert [result["source_url"] for result in results] == urls + [urls[0]]
+    assert results[0]["title"] == "first"
+    assert results[-1]["title"] == "again"
+
+
+async def test_batch_rejects_too_many_urls(mock_http, logger, image_cache):
+    seen = mock_http(lambda request: httpx.Response(500))
+    urls = [f"https://manuscripts.example.org/page/{n}.png" for n in range(logic.MAX_IMAGE_BATCH + 1)]
+
+    result = await logic.get_manuscript_images(logger, urls)
+
+    assert isinstance(result, ErrorResult)
+    assert seen == []
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from sefaria_mcp import logic
+
+pytestmark = pytest.mark.anyio
+
+
+def _hit(id_, score, ref):
+    return {"_id": id_, "_score": score, "_source": {"ref": ref}}
+
+
+RESPONSES = {
+    "Tanakh": {"hits": {"hits": [_hit("a", 1.0, "Genesis 1:1"), _hit("b", 3.0, "Genesis 1:2")], "total": {"value": 40}}},
+    "Mishnah": {"hits": {"hits": [_hit("a", 5.0, "Genesis 1:1"), _hit("c", 2.0, "Mishnah Berakhot 1:1")], "total": 2}},
+}
+
+
+def _by_filter(request):
+    filter_path = orjson.loads(request.content)["filters"][0]
+    if filter_path not in RESPONSES:
+        return httpx.Response(500, text="boom")
+    return httpx.Response(200, content=orjson.dumps(RESPONSES[filter_path]))
+
+
+async def test_merges_hits_by_best_score(mock_http, logger):
+    seen = mock_http(_by_filter)
+
+    data = await logic._search_each_filter(logger, "light", ["Tanakh", "Mishnah"], 10)
+
+    assert len(seen) == 2
+    assert [(hit["_id"], hit["_score"]) for hit in data["hits"]["hits"]] == [("a", 5.0), ("b", 3.0), ("c", 2.0)]
+    assert data["hits"]["total"] == {"value": 42}
+
+
+async def test_truncates_to_size(mock_http, logger):
+    mock_http(_by_filter)
+
+    data = await logic._search_each_filter(logger, "light", ["Tanakh", "Mishnah"], 2)
+
+    assert [hit["_id"] for hit in data["hits"]["hits"]] == ["a", "b"]
+
+
+async def test_tolerates_a_failing_filter(mock_http, logger):
+    mock_http(_by_filter)
+
+    data = await logic._search_each_filter(logger, "light", ["Tanakh", "Missing"], 10)
+
+    assert [hit["_id"] for hit in data["hits"]["hits"]] == ["b", "a"]
+    assert data["hits"]["total"] == {"value": 40}
+
+
+async def test_raises_when_every_filter_fails(mock_http, logger):
+    mock_http(_by_filter)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await logic._search_each_filter(logger, "light", ["Missing", "Unknown"], 10)
+
+
+def test_more_filters_than_the_concurrency_cap_across_event_loops(mock_http, logger):
+    filters = ["Tanakh"] * (logic._SEARCH_CONCURRENCY + 4)
+    mock_http(lambda request: httpx.Response(200, content=orjson.dumps(RESPONSES["Tanakh"])))
+
+    for _ in range(2):
+        data = asyncio.run(logic._search_each_filter(logger, "light", filters, 10))
+        assert data["hits"]["total"] == {"value": 40 * len(filters)}
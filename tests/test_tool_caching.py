@@ -0,0 +1,152 @@
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from sefaria_mcp import tools
+from sefaria_mcp.results import ErrorResult
+
+pytestmark = pytest.mark.anyio
+
+
+class _Upstream:
+    """A fake logic coroutine that blocks until released and counts its calls."""
+
+    def __init__(self, result="result"):
+        self.calls = 0
+        self.result = result
+        self.release = asyncio.Event()
+
+    async def __call__(self, logger, *args, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+
+async def test_single_flight_shares_concurrent_identical_calls():
+    upstream = _Upstream()
+    shared = tools._single_flight(upstream)
+
+    first = asyncio.ensure_future(shared(None, "light", filters={"a": [1]}))
+    second = asyncio.ensure_future(shared(None, "light", filters={"a": [1]}))
+    other = asyncio.ensure_future(shared(None, "dark"))
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await asyncio.gather(first, second, other) == ["result"] * 3
+    assert upstream.calls == 2
+
+
+async def test_single_flight_survives_a_cancelled_caller():
+    upstream = _Upstream()
+    shared = tools._single_flight(upstream)
+
+    first = asyncio.ensure_future(shared(None, "light"))
+    second = asyncio.ensure_future(shared(None, "light"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await second == "result"
+    assert first.cancelled()
+    assert upstream.calls == 1
+
+
+async def test_single_flight_retrieves_exception_of_orphaned_call():
+    unhandled = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+    upstream = _Upstream(result=RuntimeError("upstream down"))
+    shared = tools._single_flight(upstream)
+
+    caller = asyncio.ensure_future(shared(None, "light"))
+    await asyncio.sleep(0)
+    caller.cancel()
+    upstream.release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    gc.collect()
+
+    assert unhandled == []
+    # The finished call is forgotten, so the next one goes upstream again
+    upstream.result = "result"
+    assert await shared(None, "light") == "result"
+    assert upstream.calls == 2
+
+
+def test_single_flight_does_not_share_across_event_loops():
+    started = threading.Barrier(2)
+    calls = []
+
+    async def upstream(logger, query):
+        calls.append(query)
+        await asyncio.sleep(0.05)
+        return query
+
+    shared = tools._single_flight(upstream)
+    results = []
+
+    def call():
+        async def run():
+            started.wait()
+            return await shared(None, "light")
+        results.append(asyncio.run(run()))
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["light", "light"]
+    assert calls == ["light", "light"]
+
+
+async def test_ttl_cached_reuses_results_regardless_of_logger():
+    upstream = _Upstream()
+    upstream.release.set()
+    cached = tools._ttl_cached(upstream)
+
+    assert await cached("first logger", "light", filters=["Tanakh"]) == "result"
+    assert await cached("second logger", "light", filters=["Tanakh"]) == "result"
+    assert await cached("first logger", "light", filters=["Mishnah"]) == "result"
+    assert upstream.calls == 2
+    assert len(cached.cache) == 2
+
+
+@pytest.mark.parametrize("failure", [None, ErrorResult("Error during search: boom")])
+async def test_ttl_cached_skips_failures(failure):
+    upstream = _Upstream(result=failure)
+    upstream.release.set()
+    cached = tools._ttl_cached(upstream)
+
+    assert await cached(None, "light") == failure
+    upstream.result = "result"
+    assert await cached(None, "light") == "result"
+    assert await cached(None, "light") == "result"
+    assert upstream.calls == 2
+
+
+async def test_ttl_cached_expires_entries():
+    upstream = _Upstream()
+    upstream.release.set()
+    cached = tools._ttl_cached(upstream, ttl=0.01)
+
+    await cached(None, "light")
+    await asyncio.sleep(0.02)
+    await cached(None, "light")
+
+    assert upstream.calls == 2
+
+
+async def test_ttl_cached_does_not_cache_raised_errors():
+    upstream = _Upstream(result=RuntimeError("boom"))
+    upstream.release.set()
+    cached = tools._ttl_cached(upstream)
+
+    with pytest.raises(RuntimeError):
+        await cached(None, "light")
+    assert len(cached.cache) == 0
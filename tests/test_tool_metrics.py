@@ -0,0 +1,86 @@
+import httpx
+import pytest
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+from sefaria_mcp import logic, tools
+from sefaria_mcp.results import ErrorResult, TimeoutResult
+
+
+def _metrics_dict():
+    registry = CollectorRegistry()
+    return {
+        'calls': Counter("calls", "Tool calls", ["tool_name", "status"], registry=registry),
+        'duration': Histogram("duration", "Tool duration", ["tool_name"], registry=registry),
+    }
+
+
+def test_set_metrics_precreates_every_series(monkeypatch):
+    monkeypatch.setattr(tools, "_metrics", None)
+    monkeypatch.setattr(tools, "_series", {})
+    tools.set_metrics(_metrics_dict())
+
+    names = {spec.name for spec in tools._TOOL_SPECS}
+    assert tools._series['duration'] == {(name,) for name in names}
+    assert tools._series['calls'] == {(name, status) for name in names for status in tools._STATUSES}
+
+
+def test_labelled_drops_samples_past_the_series_cap(monkeypatch):
+    monkeypatch.setattr(tools, "_series", {})
+    monkeypatch.setattr(tools, "_metrics", _metrics_dict())
+    monkeypatch.setattr(tools, "_MAX_SERIES_PER_METRIC", 2)
+
+    assert tools._labelled('duration', tool_name="a") is not None
+    assert tools._labelled('duration', tool_name="b") is not None
+    assert tools._labelled('duration', tool_name="c") is None
+    # Existing series keep recording once the cap is reached
+    assert tools._labelled('duration', tool_name="a") is not None
+
+
+async def _returning(result):
+    return result
+
+
+async def _raising(error):
+    raise error
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("func, arg, status", [
+    (_returning, "result", "ok"),
+    (_returning, {"success": True}, "ok"),
+    (_returning, ErrorResult("Error during search: boom"), "error"),
+    (_returning, {"success": False, "error": "boom"}, "error"),
+    (_returning, TimeoutResult("Error during search: timed out"), "timeout"),
+    (_raising, RuntimeError("boom"), "error"),
+    (_raising, TimeoutError(), "timeout"),
+    (_raising, httpx.ReadTimeout("timed out"), "timeout"),
+])
+async def test_run_with_metrics_records_status(monkeypatch, func, arg, status):
+    metrics = _metrics_dict()
+    monkeypatch.setattr(tools, "_series", {})
+    monkeypatch.setattr(tools, "_metrics", metrics)
+
+    try:
+        await tools._run_with_metrics("text_search", func, arg)
+    except Exception:
+        pass
+
+    counts = {
+        sample.labels["status"]: sample.value
+        for sample in metrics['calls'].collect()[0].samples
+        if sample.name == "calls_total" and sample.value
+    }
+    assert counts == {status: 1}
+
+
+@pytest.mark.anyio
+async def test_upstream_timeouts_are_reported_as_timeout_results(mock_http, logger):
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    mock_http(timeout)
+
+    result = await logic.get_text(logger, "Genesis 1:1")
+
+    assert isinstance(result, TimeoutResult)
+    assert tools._result_status(result) == "timeout"
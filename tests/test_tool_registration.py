@@ -0,0 +1,16 @@
+import asyncio
+
+from fastmcp import FastMCP
+
+from sefaria_mcp import tools
+
+
+def test_registers_once_across_event_loops(monkeypatch):
+    registered = []
+    monkeypatch.setattr(tools, "register_tool_bodies", registered.append)
+    mcp = FastMCP("test")
+
+    asyncio.run(tools.ensure_tools_registered(mcp))
+    asyncio.run(tools.ensure_tools_registered(mcp))
+
+    assert registered == [mcp]